@@ -0,0 +1,225 @@
+"""
+Benchmark cases of the project libraries.
+
+Each case receives the fixtures and the scale of the run and returns the function that is
+measured; everything done before returning (generating inputs, importing the library) is
+not measured.
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import shutil
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+LIBRARIES = ROOT / 'resources' / 'libraries'
+if str(LIBRARIES) not in sys.path:
+    sys.path.insert(0, str(LIBRARIES))
+
+CASES = {}
+
+
+def case(name):
+    """Register a benchmark case."""
+    def register(function):
+        CASES[name] = function
+        return function
+    return register
+
+
+def scaled(value, scale):
+    return max(int(value * scale), 1)
+
+
+@contextlib.contextmanager
+def working_directory(directory):
+    """Run a block in another directory (contextlib.chdir needs Python 3.11)."""
+    previous = os.getcwd()
+    os.chdir(directory)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def quiet(function, *args, **kwargs):
+    """Call a function discarding what it prints."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def image_cases(size):
+    @case(f'compare_images_ssim_{size}px')
+    def compare_images(fixtures, scale):
+        from CompareTwoImages import CompareTwoImages
+
+        first, second = fixtures.image(size, 0), fixtures.image(size, 1)
+        library = CompareTwoImages()
+        return lambda: quiet(library.compare_images, str(first), str(second), 0.0)
+
+
+for image_size in (256, 1024, 2048):
+    image_cases(image_size)
+
+
+@case('compare_images_baseline_store_1024px')
+def compare_images_baseline_store(fixtures, scale):
+    from BaselineStore import build_store
+    from CompareTwoImages import CompareTwoImages
+
+    first, second = fixtures.image(1024, 0), fixtures.image(1024, 1)
+    index_path = fixtures.path('baselines.json')
+    build_store([first], index_path, root=fixtures.directory)
+    library = CompareTwoImages(baseline_store=str(index_path))
+    return lambda: quiet(library.compare_images, str(first), str(second), 0.0)
+
+
+@case('calculate_image_similarity_512px')
+def calculate_image_similarity(fixtures, scale):
+    from CompareTwoImages import CompareTwoImages
+
+    first, second = fixtures.image(512, 0), fixtures.image(512, 1)
+    library = CompareTwoImages()
+    return lambda: quiet(library.calculate_image_similarity, str(first), str(second), 0)
+
+
+@case('files_create_files_from_excel')
+def create_files_from_excel(fixtures, scale):
+    import Files
+
+    excel_file = fixtures.excel(scaled(2000, scale))
+    directory = fixtures.path('excel_files')
+
+    def run():
+        quiet(Files.createFilesBasedInExcelData, str(directory), str(excel_file), 'txt', 'Content')
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return run
+
+
+@case('read_json_file')
+def read_json_file(fixtures, scale):
+    import ReadJson
+
+    json_file = fixtures.json(scaled(50000, scale))
+    return lambda: ReadJson.read_json_file(str(json_file.parent), json_file.name)
+
+
+@case('dotenv_file_mode')
+def dotenv_file_mode(fixtures, scale):
+    import DotEnv
+
+    directory = fixtures.env_files(scaled(200, scale))
+
+    def run():
+        with working_directory(directory):
+            DotEnv.set_environment_project_variables(environment='bench')
+
+    return run
+
+
+@case('dotenv_snapshot_mode')
+def dotenv_snapshot_mode(fixtures, scale):
+    import DotEnv
+
+    directory = fixtures.env_files(scaled(200, scale))
+    with working_directory(directory):
+        DotEnv.load_environment_snapshot('bench')
+
+    def run():
+        with working_directory(directory):
+            DotEnv.set_environment_project_variables(environment='bench', snapshot=True)
+
+    return run
+
+
+@case('xml_library_get_element_text')
+def xml_library_get_element_text(fixtures, scale):
+    from robot.libraries.XML import XML
+
+    xml_file = fixtures.xml(scaled(20000, scale))
+    library = XML()
+    return lambda: library.get_element_text(library.get_element(library.parse_xml(str(xml_file)), 'header/id'))
+
+
+@case('xml_cache_get_element_text')
+def xml_cache_get_element_text(fixtures, scale):
+    from XmlCache import XmlCache
+
+    xml_file = fixtures.xml(scaled(20000, scale))
+    library = XmlCache()
+    library.get_root(xml_file)
+    return lambda: library.get_xml_element_text(str(xml_file), 'header/id')
+
+
+@case('xml_stream_count_elements')
+def xml_stream_count_elements(fixtures, scale):
+    from XmlCache import XmlCache
+
+    xml_file = fixtures.xml(scaled(200000, scale))
+    library = XmlCache()
+    return lambda: library.count_xml_elements(str(xml_file), 'item')
+
+
+@case('coverage_validator_report')
+def coverage_validator_report(fixtures, scale):
+    from robot.api import ExecutionResult
+    import test_coverage_validator
+
+    output_file = fixtures.output_xml(scaled(20, scale), 250)
+    return lambda: test_coverage_validator.generate_markdown_report(ExecutionResult(str(output_file)), 80)
+
+
+@case('brazilian_records_100k')
+def brazilian_records(fixtures, scale):
+    from BrazilianData import BrazilianData
+
+    library = BrazilianData(seed=42)
+    count = scaled(100000, scale)
+    return lambda: library.generate_brazilian_records(count)
+
+
+@case('robot_common_keywords')
+def robot_common_keywords(fixtures, scale):
+    import robot
+
+    suite = fixtures.robot_suite(scaled(2000, scale))
+
+    def run():
+        output = io.StringIO()
+        if robot.run(str(suite), output='NONE', report='NONE', log='NONE', stdout=output, stderr=output):
+            raise RuntimeError(f"{suite.name} failed:\n{output.getvalue()}")
+
+    return run
+
+
+def resource_cases(name, requirements, variables=()):
+    @case(f'robot_resource_{name}')
+    def run_resource_suite(fixtures, scale):
+        import robot
+
+        # The resources import these libraries, without them the keywords would not run as in the tests
+        for module in requirements:
+            importlib.import_module(module)
+        database = fixtures.sqlite(scaled(100000, scale)) if name.startswith('database') else None
+        suite = fixtures.resource_suite(name.split('_')[0], scaled(2000, scale), database)
+
+        def run():
+            output = io.StringIO()
+            with working_directory(ROOT):
+                failed = robot.run(str(suite), output='NONE', report='NONE', log='NONE', variable=list(variables),
+                                   stdout=output, stderr=output)
+            if failed:
+                raise RuntimeError(f"{suite.name} failed:\n{output.getvalue()}")
+
+        return run
+
+
+COMMON_LIBRARIES = ('Browser', 'FakerLibrary', 'JSONLibrary', 'RequestsLibrary')
+resource_cases('common', COMMON_LIBRARIES)
+resource_cases('database', COMMON_LIBRARIES + ('DatabaseLibrary',))
+resource_cases('database_query_cache', COMMON_LIBRARIES + ('DatabaseLibrary',), ['QUERY_CACHE:True'])
+resource_cases('xml', ())
@@ -0,0 +1,266 @@
+"""
+Synthetic inputs of the benchmarks.
+
+Every input is generated from a fixed seed, so two runs measure the same data. Inputs are
+written once to the data directory and reused by the next cases and runs.
+"""
+
+import json
+import random
+import sqlite3
+from pathlib import Path
+
+ROBOT_TIME = '2025-01-01T10:00:00.000000'
+
+# Suites that call the keywords of the .resource files, as the tests do. They are run from the
+# root of the project, so the resources find their libraries and files with ${EXECDIR}
+RESOURCE_SUITES = {
+    'common': """*** Settings ***
+Resource    ${{EXECDIR}}/resources/keywords/Common.keywords.resource
+
+
+*** Test Cases ***
+String Replace
+    FOR    ${{index}}    IN RANGE    {iterations}
+        ${{value}}=    String Replace    SELECT * FROM $$ WHERE id = $$    users    ${{index}}
+    END
+
+Get Dictionary list data by key and value
+    ${{rows}}=    Evaluate    [{{'id': str(index), 'group': str(index % 10)}} for index in range(1000)]
+    FOR    ${{index}}    IN RANGE    {lookups}
+        ${{items}}=    Get Dictionary list data by key and value    ${{rows}}    group    3
+    END
+
+Set language
+    FOR    ${{index}}    IN RANGE    {lookups}
+        Set language    pt
+    END
+""",
+    'database': """*** Settings ***
+Resource    ${{EXECDIR}}/resources/keywords/DataBase.keywords.resource
+Suite Setup    Connect To Database Using Custom Params    sqlite3    database="{database}"
+Suite Teardown    Disconnect From Database
+
+
+*** Test Cases ***
+Perform a database query
+    FOR    ${{index}}    IN RANGE    {iterations}
+        ${{rows}}=    Perform a database query    SELECT id, title FROM books WHERE author_id = ${{{{${{index}} % 100}}}}
+    END
+""",
+    'xml': """*** Settings ***
+Resource    ${{EXECDIR}}/resources/keywords/XML.keywords.resource
+
+
+*** Test Cases ***
+Return XML File Element Text
+    FOR    ${{index}}    IN RANGE    {iterations}
+        ${{text}}=    Return XML File Element Text    books.xml    header/id
+    END
+
+Return XML File Element Texts
+    FOR    ${{index}}    IN RANGE    {iterations}
+        ${{texts}}=    Return XML File Element Texts    books.xml    header/id    header/store    books/book[1]/title
+    END
+""",
+}
+
+
+class Fixtures:
+    """Generate the benchmark inputs on first use.
+
+    Args:
+        directory (str): Directory where the inputs are written
+        seed (int): Seed of the random data (default: 42)
+    """
+
+    def __init__(self, directory, seed=42):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.seed = seed
+
+    def path(self, name):
+        return self.directory / name
+
+    def image(self, size, variant=0):
+        """Return a PNG image of size x size pixels with gradients, shapes and noise.
+
+        Variants of the same size differ slightly, like two screenshots of the same page.
+        """
+        import numpy as np
+        from PIL import Image
+
+        file_path = self.path(f'image_{size}_{variant}.png')
+        if not file_path.exists():
+            rng = np.random.default_rng(self.seed)
+            y, x = np.mgrid[0:size, 0:size]
+            pixels = np.stack([(x * 255 // size), (y * 255 // size), ((x + y) * 127 // size)], axis=-1)
+            for _ in range(20):
+                top, left = rng.integers(0, size, 2)
+                height, width = rng.integers(size // 20 + 1, size // 4 + 2, 2)
+                pixels[top:top + height, left:left + width] = rng.integers(0, 256, 3)
+            noise = np.random.default_rng(self.seed + variant).normal(0, 4 + 4 * variant, pixels.shape)
+            pixels = np.clip(pixels + noise, 0, 255).astype(np.uint8)
+            Image.fromarray(pixels, 'RGB').save(file_path)
+        return file_path
+
+    def excel(self, rows):
+        """Return an XLSX file with an id, a name and a multi-line Content column."""
+        from openpyxl import Workbook
+
+        file_path = self.path(f'data_{rows}.xlsx')
+        if not file_path.exists():
+            rng = random.Random(self.seed)
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet('Data')
+            sheet.append(['Id', 'Name', 'Content'])
+            for index in range(rows):
+                content = '\n'.join(f'<line id="{line}">{rng.random():.8f}</line>' for line in range(5))
+                sheet.append([index, f'Name {index}', content])
+            workbook.save(file_path)
+        return file_path
+
+    def json(self, records):
+        """Return a JSON file with a list of nested records, similar to API responses."""
+        file_path = self.path(f'data_{records}.json')
+        if not file_path.exists():
+            rng = random.Random(self.seed)
+            data = [{
+                'id': index,
+                'isbn': f'978{rng.randrange(10 ** 10):010d}',
+                'title': f'Book {index}',
+                'pages': rng.randrange(50, 1500),
+                'tags': [f'tag{rng.randrange(100)}' for _ in range(5)],
+                'author': {'name': f'Author {index % 1000}', 'country': rng.choice(['BR', 'AR', 'CO', 'MX'])},
+            } for index in range(records)]
+            with open(file_path, 'w', encoding='utf-8') as json_file:
+                json.dump(data, json_file)
+        return file_path
+
+    def xml(self, items):
+        """Return an XML file with a header and many item elements."""
+        file_path = self.path(f'data_{items}.xml')
+        if not file_path.exists():
+            rng = random.Random(self.seed)
+            with open(file_path, 'w', encoding='utf-8') as xml_file:
+                xml_file.write('<?xml version="1.0" encoding="UTF-8"?>\n<invoice xmlns="urn:benchmark">\n')
+                xml_file.write('<header><id>INV-1</id><date>2025-01-01</date><customer>Customer</customer></header>\n')
+                xml_file.write('<items>\n')
+                for index in range(items):
+                    xml_file.write(f'<item id="{index}"><name>Item {index}</name>'
+                                   f'<price>{rng.random() * 100:.2f}</price><quantity>{rng.randrange(1, 10)}</quantity>'
+                                   f'</item>\n')
+                xml_file.write(f'</items>\n<total>{items}</total>\n</invoice>\n')
+        return file_path
+
+    def output_xml(self, suites, tests_per_suite, keywords_per_test=3):
+        """Return a Robot Framework 7 output.xml with passed, failed and skipped tests."""
+        file_path = self.path(f'output_{suites}x{tests_per_suite}.xml')
+        if not file_path.exists():
+            status = f'start="{ROBOT_TIME}" elapsed="0.001"'
+            totals = {'PASS': 0, 'FAIL': 0, 'SKIP': 0}
+            suite_statistics = []
+            with open(file_path, 'w', encoding='utf-8') as output:
+                output.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                             f'<robot generator="Robot 7.2.2 (Python 3.12 on linux)" generated="{ROBOT_TIME}" '
+                             'rpa="false" schemaversion="5">\n'
+                             '<suite id="s1" name="Benchmark" source="/benchmark">\n')
+                for suite in range(1, suites + 1):
+                    counts = {'PASS': 0, 'FAIL': 0, 'SKIP': 0}
+                    output.write(f'<suite id="s1-s{suite}" name="Suite {suite}" '
+                                 f'source="/benchmark/suite_{suite}.robot">\n')
+                    for test in range(1, tests_per_suite + 1):
+                        result = 'FAIL' if test % 10 == 0 else 'SKIP' if test % 25 == 0 else 'PASS'
+                        counts[result] += 1
+                        output.write(f'<test id="s1-s{suite}-t{test}" name="Test {test}" line="{test * 4}">\n')
+                        for keyword in range(keywords_per_test):
+                            output.write(f'<kw name="Log" owner="BuiltIn">\n'
+                                         f'<msg time="{ROBOT_TIME}" level="INFO">Message {keyword}</msg>\n'
+                                         f'<arg>Message {keyword}</arg>\n'
+                                         '<doc>Logs the given message with the given level.</doc>\n'
+                                         f'<status status="PASS" {status}/>\n</kw>\n')
+                        message = 'Expected failure' if result == 'FAIL' else 'Skipped' if result == 'SKIP' else ''
+                        output.write(f'<tag>benchmark</tag>\n<status status="{result}" {status}>{message}</status>\n'
+                                     '</test>\n')
+                    suite_status = 'FAIL' if counts['FAIL'] else 'PASS'
+                    output.write(f'<status status="{suite_status}" {status}/>\n</suite>\n')
+                    suite_statistics.append((suite, counts))
+                    for result, count in counts.items():
+                        totals[result] += count
+                output.write(f'<status status="{"FAIL" if totals["FAIL"] else "PASS"}" {status}/>\n</suite>\n')
+                output.write('<statistics>\n<total>\n'
+                             f'<stat pass="{totals["PASS"]}" fail="{totals["FAIL"]}" skip="{totals["SKIP"]}">'
+                             'All Tests</stat>\n</total>\n<tag>\n'
+                             f'<stat pass="{totals["PASS"]}" fail="{totals["FAIL"]}" skip="{totals["SKIP"]}">'
+                             'benchmark</stat>\n</tag>\n<suite>\n')
+                for suite, counts in suite_statistics:
+                    output.write(f'<stat pass="{counts["PASS"]}" fail="{counts["FAIL"]}" skip="{counts["SKIP"]}" '
+                                 f'id="s1-s{suite}" name="Suite {suite}">Benchmark.Suite {suite}</stat>\n')
+                output.write('</suite>\n</statistics>\n<errors>\n</errors>\n</robot>\n')
+        return file_path
+
+    def env_files(self, variables):
+        """Return a directory with .env, bench.env and bench.local.env layers."""
+        directory = self.path(f'env_{variables}')
+        if not directory.exists():
+            directory.mkdir()
+            (directory / '.env').write_text(
+                ''.join(f'BASE_{index}=value_{index}\n' for index in range(variables)), encoding='utf-8')
+            (directory / 'bench.env').write_text(
+                ''.join(f'BENCH_{index}=${{BASE_{index}}}_bench\n' for index in range(variables)), encoding='utf-8')
+            (directory / 'bench.local.env').write_text('BENCH_0=local\n', encoding='utf-8')
+        return directory
+
+    def robot_suite(self, iterations):
+        """Return a suite that calls the Python keywords behind the most used Common keywords."""
+        libraries = Path(__file__).resolve().parents[1] / 'resources' / 'libraries'
+        file_path = self.path(f'keywords_{iterations}.robot')
+        if not file_path.exists():
+            file_path.write_text(f"""*** Settings ***
+Library    {libraries.as_posix()}/Templates.py
+Library    {libraries.as_posix()}/IndexedData.py
+Library    {libraries.as_posix()}/I18n.py
+
+
+*** Test Cases ***
+String Replace
+    FOR    ${{index}}    IN RANGE    {iterations}
+        ${{value}}=    Render Positional Template    SELECT * FROM $$ WHERE id = $$    users    ${{index}}
+    END
+
+Get Dictionary list data by key and value
+    ${{rows}}=    Evaluate    [{{'id': str(index), 'group': str(index % 10)}} for index in range(1000)]
+    FOR    ${{index}}    IN RANGE    {max(iterations // 10, 1)}
+        ${{items}}=    Filter Dictionary List By Key And Value    ${{rows}}    group    3
+    END
+
+Translate
+    FOR    ${{index}}    IN RANGE    {iterations}
+        ${{value}}=    Translate    DEMOQA    pt    default=DEMOQA
+    END
+""", encoding='utf-8')
+        return file_path
+
+    def sqlite(self, rows):
+        """Return a SQLite database with a books table, 100 authors and an index by author."""
+        file_path = self.path(f'books_{rows}.sqlite')
+        if not file_path.exists():
+            rng = random.Random(self.seed)
+            connection = sqlite3.connect(file_path)
+            with connection:
+                connection.execute('CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT, author_id INTEGER, '
+                                   'pages INTEGER)')
+                connection.execute('CREATE INDEX books_author ON books (author_id)')
+                connection.executemany('INSERT INTO books VALUES (?, ?, ?, ?)', (
+                    (index, f'Book {index}', index % 100, rng.randrange(50, 1500)) for index in range(rows)))
+            connection.close()
+        return file_path
+
+    def resource_suite(self, name, iterations, database=None):
+        """Return a suite that calls the keywords of a .resource file (see RESOURCE_SUITES)."""
+        file_path = self.path(f'resource_{name}_{iterations}.robot')
+        if not file_path.exists():
+            file_path.write_text(RESOURCE_SUITES[name].format(
+                iterations=iterations, lookups=max(iterations // 10, 1),
+                database=Path(database).as_posix() if database else None), encoding='utf-8')
+        return file_path
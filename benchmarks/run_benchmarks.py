@@ -0,0 +1,217 @@
+"""
+Benchmark Runner
+
+Measures the time and peak memory of the project libraries and the most used keywords
+with synthetic inputs, fully offline. Each case runs a warm-up call, then is timed
+``--repeat`` times with a monotonic clock; the peak memory is taken in a separate call
+with tracemalloc, so the tracing does not change the timings. Cases whose dependencies
+are not installed are skipped and the reason is stored in the results.
+
+Usage:
+    # Run all cases and write benchmarks/results/latest.json
+    python benchmarks/run_benchmarks.py run
+
+    # Quick run of the XML cases with smaller inputs
+    python benchmarks/run_benchmarks.py run --quick --filter xml
+
+    # Compare with a baseline, exits with code 1 if a case is slower by more than 20%
+    python benchmarks/run_benchmarks.py compare benchmarks/results/baseline.json benchmarks/results/latest.json
+"""
+
+import json
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from cases import CASES  # noqa: E402
+from fixtures import Fixtures  # noqa: E402
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / 'results' / 'latest.json'
+
+
+def measure(function, repeat):
+    """Time a function and measure its peak memory.
+
+    Args:
+        function (callable): Function to measure, without arguments
+        repeat (int): Number of timed calls
+
+    Returns:
+        dict: min, median and max seconds of the calls and peak memory in bytes
+    """
+    function()
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'max_s': max(timings),
+        'repeat': repeat,
+        'peak_memory_bytes': peak,
+    }
+
+
+def run_cases(data_dir, pattern=None, repeat=5, scale=1.0):
+    """Run the benchmark cases.
+
+    Args:
+        data_dir (str): Directory of the generated inputs
+        pattern (str): Regular expression of the case names to run (default: all)
+        repeat (int): Number of timed calls of each case (default: 5)
+        scale (float): Multiplier of the input sizes (default: 1.0)
+
+    Returns:
+        dict: Metadata of the run and results by case name
+    """
+    import robot
+
+    fixtures = Fixtures(data_dir)
+    results = {}
+    for name, setup in CASES.items():
+        if pattern and not re.search(pattern, name):
+            continue
+        try:
+            function = setup(fixtures, scale)
+        except ImportError as error:
+            results[name] = {'skipped': f"missing dependency: {error.name or error}"}
+            print(f"{name:<40} skipped ({results[name]['skipped']})")
+            continue
+        results[name] = measure(function, repeat)
+        print(f"{name:<40} {results[name]['median_s'] * 1000:>10.2f} ms "
+              f"{results[name]['peak_memory_bytes'] / 2 ** 20:>9.2f} MiB")
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'robot': robot.__version__,
+            'repeat': repeat,
+            'scale': scale,
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline, current, threshold=0.2, memory_threshold=None):
+    """Compare two benchmark runs.
+
+    Args:
+        baseline (dict): Results of the reference run
+        current (dict): Results of the new run
+        threshold (float): Allowed increase of the median time, 0.2 is 20% (default: 0.2)
+        memory_threshold (float): Allowed increase of the peak memory (default: not checked)
+
+    Returns:
+        tuple: Markdown report and names of the regressed cases
+    """
+    if baseline['meta'].get('scale') != current['meta'].get('scale'):
+        print("Warning: the runs used different scales, the results are not comparable")
+
+    report = "| Case | Baseline (ms) | Current (ms) | Time | Baseline (MiB) | Current (MiB) | Memory | Status |\n"
+    report += "|------|---------------|--------------|------|----------------|---------------|--------|--------|\n"
+    regressions = []
+    for name in sorted(set(baseline['results']) | set(current['results'])):
+        before = baseline['results'].get(name, {})
+        after = current['results'].get(name, {})
+        if 'median_s' not in before or 'median_s' not in after:
+            report += f"| {name} | | | | | | | {after.get('skipped', 'not comparable')} |\n"
+            continue
+
+        time_change = after['median_s'] / before['median_s'] - 1 if before['median_s'] else 0.0
+        memory_change = (after['peak_memory_bytes'] / before['peak_memory_bytes'] - 1
+                         if before['peak_memory_bytes'] else 0.0)
+        regressed = time_change > threshold or (memory_threshold is not None and memory_change > memory_threshold)
+        if regressed:
+            regressions.append(name)
+        report += (f"| {name} | {before['median_s'] * 1000:.2f} | {after['median_s'] * 1000:.2f} | "
+                   f"{time_change:+.1%} | {before['peak_memory_bytes'] / 2 ** 20:.2f} | "
+                   f"{after['peak_memory_bytes'] / 2 ** 20:.2f} | {memory_change:+.1%} | "
+                   f"{'REGRESSION' if regressed else 'OK'} |\n")
+    return report, regressions
+
+
+def main():
+    """
+    Main function for command-line execution.
+
+    Command-line arguments:
+        run: Run the cases and write the results JSON
+        compare: Compare a baseline results JSON with a current one
+
+    Example usage:
+        python benchmarks/run_benchmarks.py run --output benchmarks/results/baseline.json
+        python benchmarks/run_benchmarks.py compare benchmarks/results/baseline.json benchmarks/results/latest.json
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmarks of the project libraries')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmark cases')
+    run_parser.add_argument('--output', default=str(DEFAULT_OUTPUT),
+                            help='Results JSON file (default: benchmarks/results/latest.json)')
+    run_parser.add_argument('--data-dir', default=None,
+                            help='Directory of the generated inputs, reused between runs (default: temporary)')
+    run_parser.add_argument('--filter', default=None, help='Regular expression of the case names to run')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Timed calls of each case (default: 5)')
+    run_parser.add_argument('--scale', type=float, default=1.0, help='Multiplier of the input sizes (default: 1.0)')
+    run_parser.add_argument('--quick', action='store_true', help='Use --repeat 2 --scale 0.1')
+
+    compare_parser = commands.add_parser('compare', help='Compare two results files')
+    compare_parser.add_argument('baseline', help='Results JSON of the reference run')
+    compare_parser.add_argument('current', help='Results JSON of the new run')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='Allowed increase of the median time (default: 0.2 = 20%%)')
+    compare_parser.add_argument('--memory-threshold', type=float, default=None,
+                                help='Allowed increase of the peak memory (default: not checked)')
+    args = parser.parse_args()
+
+    if args.command == 'compare':
+        with open(args.baseline, encoding='utf-8') as baseline_file, \
+                open(args.current, encoding='utf-8') as current_file:
+            report, regressions = compare_results(json.load(baseline_file), json.load(current_file),
+                                                  args.threshold, args.memory_threshold)
+        print(report)
+        if regressions:
+            print(f"{len(regressions)} regressions: {', '.join(regressions)}")
+            return 1
+        print("No regressions")
+        return 0
+
+    repeat, scale = (2, 0.1) if args.quick else (args.repeat, args.scale)
+    if args.data_dir:
+        data = run_cases(args.data_dir, args.filter, repeat, scale)
+    else:
+        with tempfile.TemporaryDirectory(prefix='benchmarks_') as data_dir:
+            data = run_cases(data_dir, args.filter, repeat, scale)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as output_file:
+        json.dump(data, output_file, indent=2)
+    print(f"Results saved to: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
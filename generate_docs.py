@@ -6,17 +6,38 @@ and test suites using the libdoc and testdoc tools.
 
 It scans the resources and tests directories for .resource, .robot, and .py files,
 then generates documentation for each file in the documentation directory.
+
+With --incremental, only the files whose content (or the content of the resources
+they import) changed since the last run are regenerated. See DocumentationManifest.
+
+With --workers N, the files are first collected as a list of work items and the
+documentation is generated by a pool of N processes.
 """
 
+import argparse
+import hashlib
+import json
 import os
+import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from robot.libdoc import libdoc
 from robot.testdoc import testdoc
+from robot.version import VERSION as ROBOT_VERSION
 
 # Files to exclude from documentation generation
-EXCLUDED_FILES = ['__init__.py', 'config_variables.py', 'test_coverage_validator.py', '__init__.robot']
+EXCLUDED_FILES = ['__init__.py', 'config_variables.py', 'test_coverage_validator.py', '__init__.robot',
+                  'KeywordProfiler.py', 'StreamingReader.py', 'ResourceSampler.py',
+                  'BaselineStore.py']
+
+# Manifest with the content hashes used by the incremental mode
+MANIFEST_FILE = '.docs_manifest.json'
+
+# Resource, Library and Variables imports in the Settings section
+IMPORT_PATTERN = re.compile(r'^(?:Resource|Library|Variables)(?: {2,}|\t)\s*(\S+)', re.IGNORECASE)
 
 def create_documentation_directory(doc_dir):
     """
@@ -69,7 +90,170 @@ def generate_test_documentation(source_file, output_file):
         print(f"Error generating test documentation for {source_file}: {e}")
         return False
 
-def process_resources_directory(directory, doc_dir, processed_files=None):
+class DocumentationManifest:
+    """
+    Keeps the content hashes of the documented files between runs.
+
+    The hash of a source file includes the hashes of all the resource, library and
+    variable files it imports (recursively) and the Robot Framework version, so a
+    change in an imported resource also regenerates the documentation of the files
+    that use it.
+    """
+
+    def __init__(self, doc_dir):
+        """
+        Load the manifest of the previous run, if it exists.
+
+        Args:
+            doc_dir (Path): Documentation output directory
+        """
+        self.path = doc_dir / MANIFEST_FILE
+        self.previous = {}
+        self.entries = {}
+        self._file_hashes = {}
+        if self.path.exists():
+            try:
+                with open(self.path, encoding='utf-8') as manifest_file:
+                    self.previous = json.load(manifest_file).get('files', {})
+            except (OSError, ValueError) as e:
+                print(f"Ignoring invalid documentation manifest {self.path}: {e}")
+
+    def is_up_to_date(self, source_file, output_file):
+        """
+        Check if the documentation of a file can be reused.
+
+        Args:
+            source_file (Path): Path to the source file
+            output_file (Path): Path to the output HTML file
+
+        Returns:
+            bool: True if the inputs did not change and the output file exists
+        """
+        entry = self.previous.get(self._key(source_file))
+        return (entry is not None
+                and entry['hash'] == self.input_hash(source_file)
+                and output_file.exists())
+
+    def record(self, source_file, output_file):
+        """
+        Register a documented file in the new manifest.
+
+        Args:
+            source_file (Path): Path to the source file
+            output_file (Path): Path to the generated HTML file
+        """
+        self.entries[self._key(source_file)] = {
+            'hash': self.input_hash(source_file),
+            'output': output_file.relative_to(self.path.parent).as_posix(),
+        }
+
+    def prune(self):
+        """
+        Remove the documentation of source files that no longer exist.
+
+        Returns:
+            list: Removed documentation files
+        """
+        removed = []
+        for key, entry in self.previous.items():
+            if key in self.entries or (project_root / key).exists():
+                continue
+            output_file = self.path.parent / entry['output']
+            if output_file.exists():
+                output_file.unlink()
+                removed.append(output_file)
+                print(f"Removed documentation of deleted file: {key}")
+        return removed
+
+    def file_set_changed(self):
+        """
+        Check if the set of documented files differs from the previous run.
+
+        Returns:
+            bool: True if files were added or removed
+        """
+        return set(self.entries) != set(self.previous)
+
+    def save(self):
+        """Write the manifest to the documentation directory."""
+        with open(self.path, 'w', encoding='utf-8') as manifest_file:
+            json.dump({'robot_version': ROBOT_VERSION, 'files': self.entries},
+                      manifest_file, indent=2, sort_keys=True)
+
+    def input_hash(self, source_file):
+        """
+        Calculate the hash of a file and of everything it imports.
+
+        Args:
+            source_file (Path): Path to the source file
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        digest = hashlib.sha256(ROBOT_VERSION.encode())
+        for dependency in sorted(self._dependencies(source_file)):
+            digest.update(self._key(dependency).encode())
+            digest.update(self._file_hash(dependency).encode())
+        return digest.hexdigest()
+
+    def _dependencies(self, source_file):
+        # The file itself plus every file it imports, recursively
+        found = set()
+        pending = [Path(source_file).resolve()]
+        while pending:
+            current = pending.pop()
+            if current in found:
+                continue
+            found.add(current)
+            pending.extend(find_imported_files(current))
+        return found
+
+    def _file_hash(self, path):
+        if path not in self._file_hashes:
+            self._file_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self._file_hashes[path]
+
+    @staticmethod
+    def _key(path):
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(project_root.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+def find_imported_files(source_file):
+    """
+    Find the local files imported by a resource or test suite file.
+
+    Only imports pointing to existing files are returned, imports of installed
+    libraries (Browser, Collections...) are ignored.
+
+    Args:
+        source_file (Path): Path to the source file
+
+    Returns:
+        list: Paths of the imported files
+    """
+    if source_file.suffix.lower() not in ['.resource', '.robot']:
+        return []
+
+    imported_files = []
+    with open(source_file, encoding='utf-8', errors='replace') as source:
+        for line in source:
+            match = IMPORT_PATTERN.match(line)
+            if not match:
+                continue
+            name = (match.group(1)
+                    .replace('${EXECDIR}', str(project_root))
+                    .replace('${CURDIR}', str(source_file.parent)))
+            path = Path(name)
+            if not path.is_absolute():
+                path = source_file.parent / path
+            if path.is_file():
+                imported_files.append(path.resolve())
+    return imported_files
+
+def process_resources_directory(directory, doc_dir, processed_files=None, manifest=None, incremental=False):
     """
     Process a directory to find and document resources and Python libraries.
 
@@ -77,6 +261,8 @@ def process_resources_directory(directory, doc_dir, processed_files=None):
         directory (Path): Directory to process
         doc_dir (Path): Documentation output directory
         processed_files (set, optional): Set of already processed files
+        manifest (DocumentationManifest, optional): Manifest where documented files are recorded
+        incremental (bool): Skip files whose documentation is up to date in the manifest
 
     Returns:
         set: Set of processed files
@@ -103,18 +289,27 @@ def process_resources_directory(directory, doc_dir, processed_files=None):
                 # Generate output filename
                 output_file = output_dir / f"{item.stem}.html"
 
+                # Reuse documentation whose inputs did not change
+                if incremental and manifest.is_up_to_date(item, output_file):
+                    manifest.record(item, output_file)
+                    processed_files.add(item)
+                    print(f"Documentation up to date: {item}")
+                    continue
+
                 # Generate documentation
                 if generate_library_documentation(item, output_file):
                     processed_files.add(item)
+                    if manifest is not None:
+                        manifest.record(item, output_file)
                     print(f"Successfully processed resource: {item}")
 
         elif item.is_dir() and not item.name.startswith('.'):
             # Recursively process subdirectories
-            process_resources_directory(item, doc_dir, processed_files)
+            process_resources_directory(item, doc_dir, processed_files, manifest, incremental)
 
     return processed_files
 
-def process_tests_directory(directory, doc_dir, processed_files=None):
+def process_tests_directory(directory, doc_dir, processed_files=None, manifest=None, incremental=False):
     """
     Process a directory to find and document test suites.
 
@@ -122,6 +317,8 @@ def process_tests_directory(directory, doc_dir, processed_files=None):
         directory (Path): Directory to process
         doc_dir (Path): Documentation output directory
         processed_files (set, optional): Set of already processed files
+        manifest (DocumentationManifest, optional): Manifest where documented files are recorded
+        incremental (bool): Skip files whose documentation is up to date in the manifest
 
     Returns:
         set: Set of processed files
@@ -148,17 +345,120 @@ def process_tests_directory(directory, doc_dir, processed_files=None):
                 # Generate output filename
                 output_file = output_dir / f"{item.stem}.html"
 
+                # Reuse documentation whose inputs did not change
+                if incremental and manifest.is_up_to_date(item, output_file):
+                    manifest.record(item, output_file)
+                    processed_files.add(item)
+                    print(f"Documentation up to date: {item}")
+                    continue
+
                 # Generate documentation
                 if generate_test_documentation(item, output_file):
                     processed_files.add(item)
+                    if manifest is not None:
+                        manifest.record(item, output_file)
                     print(f"Successfully processed test: {item}")
 
         elif item.is_dir() and not item.name.startswith('.'):
             # Recursively process subdirectories
-            process_tests_directory(item, doc_dir, processed_files)
+            process_tests_directory(item, doc_dir, processed_files, manifest, incremental)
 
     return processed_files
 
+def collect_work_items(directory, base_dir, doc_dir, kind, items=None):
+    """
+    Collect the files of a directory that must be documented.
+
+    Uses the same rules as process_resources_directory and process_tests_directory,
+    but only builds the list of work items, without generating any documentation.
+
+    Args:
+        directory (Path): Directory to process
+        base_dir (Path): Root directory (resources or tests) used for the output structure
+        doc_dir (Path): Documentation output directory
+        kind (str): 'library' for resources and libraries, 'test' for test suites
+        items (list, optional): List where the work items are appended
+
+    Returns:
+        list: Work items as (kind, source file, output file) tuples
+    """
+    if items is None:
+        items = []
+
+    suffixes = ['.resource', '.robot', '.py'] if kind == 'library' else ['.robot']
+
+    for item in sorted(directory.iterdir()):
+        if item.is_file():
+            if item.name in EXCLUDED_FILES or item.suffix.lower() not in suffixes:
+                continue
+            relative_path = item.relative_to(base_dir)
+            output_file = doc_dir / base_dir.name / relative_path.parent / f"{item.stem}.html"
+            items.append((kind, item, output_file))
+        elif item.is_dir() and not item.name.startswith('.'):
+            collect_work_items(item, base_dir, doc_dir, kind, items)
+
+    return items
+
+def generate_work_item(work_item):
+    """
+    Generate the documentation of a single work item.
+
+    This function runs inside the worker processes of generate_in_parallel.
+
+    Args:
+        work_item (tuple): (kind, source file, output file)
+
+    Returns:
+        tuple: (work item, True if generated successfully, elapsed seconds)
+    """
+    kind, source_file, output_file = work_item
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    if kind == 'library':
+        success = generate_library_documentation(source_file, output_file)
+    else:
+        success = generate_test_documentation(source_file, output_file)
+    return work_item, success, time.perf_counter() - start
+
+def generate_in_parallel(work_items, workers):
+    """
+    Generate documentation for a list of work items using a process pool.
+
+    Prints the time spent on each file and the total throughput.
+
+    Args:
+        work_items (list): Work items as returned by collect_work_items
+        workers (int): Number of worker processes
+
+    Returns:
+        tuple: (list of successful work items, list of failed work items)
+    """
+    successes = []
+    failures = []
+    if not work_items:
+        return successes, failures
+
+    print(f"Generating documentation for {len(work_items)} files using {workers} workers")
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(generate_work_item, work_item) for work_item in work_items]
+        for future in as_completed(futures):
+            work_item, success, elapsed = future.result()
+            if success:
+                successes.append(work_item)
+            else:
+                failures.append(work_item)
+            print(f"[{'OK' if success else 'FAIL'}] {elapsed:.2f}s {work_item[1]}")
+
+    total = time.perf_counter() - start
+    print(f"Generated {len(successes)} files in {total:.2f}s "
+          f"({len(work_items) / total:.2f} files/s), {len(failures)} failures")
+    for work_item in failures:
+        print(f"Failed to generate documentation for: {work_item[1]}")
+
+    return successes, failures
+
 def create_index_file(doc_dir, resource_files, test_files, project_name):
     """
     Create an index.html file that links to all generated documentation files.
@@ -324,12 +624,76 @@ def create_index_file(doc_dir, resource_files, test_files, project_name):
 
     print(f"Index file created: {index_path}")
 
+def generate_documentation_in_parallel(resources_dir, tests_dir, doc_dir, manifest, incremental, workers):
+    """
+    Generate documentation for resources and test suites using a process pool.
+
+    Args:
+        resources_dir (Path): Resources directory
+        tests_dir (Path): Tests directory
+        doc_dir (Path): Documentation output directory
+        manifest (DocumentationManifest): Manifest where documented files are recorded
+        incremental (bool): Skip files whose documentation is up to date in the manifest
+        workers (int): Number of worker processes
+
+    Returns:
+        tuple: (set of processed resource files, set of processed test files)
+    """
+    work_items = []
+    for directory, kind in [(resources_dir, 'library'), (tests_dir, 'test')]:
+        if directory.exists():
+            collect_work_items(directory, directory, doc_dir, kind, work_items)
+        else:
+            print(f"Warning: Directory not found: {directory}")
+
+    create_documentation_directory(doc_dir)
+
+    pending_items = []
+    processed = {'library': set(), 'test': set()}
+    for work_item in work_items:
+        kind, source_file, output_file = work_item
+        if incremental and manifest.is_up_to_date(source_file, output_file):
+            manifest.record(source_file, output_file)
+            processed[kind].add(source_file)
+            print(f"Documentation up to date: {source_file}")
+        else:
+            pending_items.append(work_item)
+
+    successes, _ = generate_in_parallel(pending_items, workers)
+    for kind, source_file, output_file in successes:
+        manifest.record(source_file, output_file)
+        processed[kind].add(source_file)
+
+    print(f"Processed {len(processed['library'])} resource files")
+    print(f"Processed {len(processed['test'])} test files")
+    return processed['library'], processed['test']
+
+def parse_arguments():
+    """
+    Parse the command-line arguments.
+
+    Command-line arguments:
+        --incremental: Regenerate only the documentation whose source files changed
+        --workers: Number of processes used to generate documentation (default: 1, 0 uses all CPUs)
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Documentation Generator')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Regenerate only files whose content or imported resources changed')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of processes used to generate documentation (default: 1, 0 uses all CPUs)')
+    return parser.parse_args()
+
 def main():
     """
     Main function to generate documentation for resources, libraries, and test suites.
     """
     global project_root
 
+    args = parse_arguments()
+
     # Determine project root (assuming this script is in the project root)
     project_root = Path(__file__).parent
 
@@ -342,34 +706,58 @@ def main():
     tests_dir = project_root / 'tests'
     doc_dir = project_root / 'documentation'
 
-    # Check if directories exist
-    if not resources_dir.exists():
-        print(f"Warning: Resources directory not found: {resources_dir}")
-        resource_files = set()
+    # Content hashes of the previous run, used to skip unchanged files
+    manifest = DocumentationManifest(doc_dir)
+    if args.incremental:
+        print("Incremental mode: only changed files will be regenerated")
+
+    workers = args.workers or os.cpu_count() or 1
+
+    if workers > 1:
+        resource_files, test_files = generate_documentation_in_parallel(
+            resources_dir, tests_dir, doc_dir, manifest, args.incremental, workers)
     else:
-        # Create documentation directory
-        create_documentation_directory(doc_dir)
-        # Process resources directory
-        resource_files = process_resources_directory(resources_dir, doc_dir)
-        print(f"Processed {len(resource_files)} resource files")
-
-    if not tests_dir.exists():
-        print(f"Warning: Tests directory not found: {tests_dir}")
-        test_files = set()
+        # Check if directories exist
+        if not resources_dir.exists():
+            print(f"Warning: Resources directory not found: {resources_dir}")
+            resource_files = set()
+        else:
+            # Create documentation directory
+            create_documentation_directory(doc_dir)
+            # Process resources directory
+            resource_files = process_resources_directory(resources_dir, doc_dir, manifest=manifest,
+                                                        incremental=args.incremental)
+            print(f"Processed {len(resource_files)} resource files")
+
+        if not tests_dir.exists():
+            print(f"Warning: Tests directory not found: {tests_dir}")
+            test_files = set()
+        else:
+            # Create documentation directory
+            create_documentation_directory(doc_dir)
+            # Process tests directory
+            test_files = process_tests_directory(tests_dir, doc_dir, manifest=manifest,
+                                                 incremental=args.incremental)
+            print(f"Processed {len(test_files)} test files")
+
+    # Remove documentation of deleted files
+    removed_files = manifest.prune()
+
+    # Create index file with project name, in incremental mode only when the set of files changed
+    if args.incremental and not manifest.file_set_changed() and (doc_dir / "index.html").exists():
+        print("Index file is up to date")
     else:
-        # Create documentation directory
-        create_documentation_directory(doc_dir)
-        # Process tests directory
-        test_files = process_tests_directory(tests_dir, doc_dir)
-        print(f"Processed {len(test_files)} test files")
+        create_index_file(doc_dir, resource_files, test_files, project_name)
 
-    # Create index file with project name
-    create_index_file(doc_dir, resource_files, test_files, project_name)
+    create_documentation_directory(doc_dir)
+    manifest.save()
 
     # Print summary
     print(f"\nDocumentation generation complete!")
     print(f"Total resource files processed: {len(resource_files)}")
     print(f"Total test files processed: {len(test_files)}")
+    if removed_files:
+        print(f"Total documentation files removed: {len(removed_files)}")
     print(f"Documentation saved to: {doc_dir}")
 
     return 0
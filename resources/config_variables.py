@@ -5,6 +5,10 @@ HEADLESS = False
 
 PIPELINE = False
 ENVIRONMENT = "UAT"
+# Resolve .env -> [environment].env -> [environment].local.env once and reuse it in every process (see DotEnv.py)
+ENV_SNAPSHOT = False
+# Cache the results of read-only queries of Perform a database query (see QueryCache.py)
+QUERY_CACHE = False
 
 URLS = {
     'DEV': 'https://demoqa.com/',
@@ -16,7 +20,18 @@ URLS = {
 
 LANG = "pt"
 
+# Languages used when a key does not exist in the selected language file (see I18n.py)
+LANG_FALLBACKS = {
+    "ar": "pt",
+    "co": "pt",
+    "mx": "pt",
+    "page_pt": "pt"
+}
+
 MOBILE = False
+# Keep one browser per process and open a new context for each test (see BrowserPool.py).
+# Only useful when a process runs several web tests: robot or pabot without --testlevelsplit
+BROWSER_POOL = False
 DEVICE_NAME = "Nexus 5"
 
 NEW_CONTEXT = {
@@ -0,0 +1,245 @@
+import gzip
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from robot.api import Failure, logger
+from robot.api.deco import keyword, not_keyword
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import get_link_path
+
+# Characters replaced in the artifact names to build the file names
+UNSAFE_NAME_PATTERN = re.compile(r'[^\w.-]+')
+
+IMAGE_EXTENSIONS = ('png', 'jpeg', 'jpg', 'webp')
+
+# Pillow format names and options of the re-encoded images
+IMAGE_FORMATS = {
+    'png': ('PNG', {'optimize': True}),
+    'jpeg': ('JPEG', {'optimize': True}),
+    'webp': ('WEBP', {'method': 4}),
+}
+
+
+class ArtifactWriter:
+    """Library to write screenshots and downloads in background threads.
+
+    The keywords receive the content of the artifact and return at once: the content is
+    hashed, and re-encoded, compressed and written to disk by a thread pool, so these
+    steps are no longer part of the test duration. Files are named by the hash of their
+    content, so identical screenshots (e.g. the same page in every retry) are written
+    only once, and the log gets a link to the file instead of an embedded image.
+
+    Artifacts are written to the ``artifacts`` folder of the output directory by default.
+    `Flush Artifacts` waits for the pending writes (use it in the suite teardown); the
+    pending writes are flushed anyway when the execution ends.
+
+    = Usage =
+
+    | ${screenshot}=   | Take Screenshot | log_screenshot=False | return_as=bytes |
+    | ${path}=         | Write Artifact  | ${screenshot}        | name=login      | extension=png |
+    | ${path}=         | Write File Artifact | ${download}[saveAs] | remove_source=True |
+    | Flush Artifacts  |                 |                      |                 |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, output_dir=None, workers=2, image_format=None, quality=85):
+        """Initialize the ArtifactWriter library.
+
+        Args:
+            output_dir (str): Directory of the artifacts (default: ${OUTPUT DIR}/artifacts)
+            workers (int): Threads that encode and write the artifacts (default: 2)
+            image_format (str): Re-encode the images as png, jpeg or webp (default: keep the received bytes)
+            quality (int): Quality of the jpeg and webp images (default: 85)
+        """
+        self.ROBOT_LIBRARY_LISTENER = self
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.workers = int(workers)
+        self.image_format = image_format.lower() if image_format else None
+        self.quality = int(quality)
+        self._executor = None
+        self._pending = []
+        self._paths = {}
+        self._errors = []
+        self._lock = threading.Lock()
+        self.written = 0
+        self.duplicates = 0
+        self.bytes_received = 0
+        self.bytes_written = 0
+
+    @keyword('Write Artifact')
+    def write_artifact(self, content, name='artifact', extension='bin', image_format=None, compress: bool = False):
+        """Write an artifact in background, returning the path it will have.
+
+        Args:
+            content (bytes): Content of the artifact, strings are written as UTF-8
+            name (str): Name of the artifact, prefix of the file name and text of the log link (default: artifact)
+            extension (str): Extension of the received content, e.g. png (default: bin)
+            image_format (str): Re-encode an image as png, jpeg or webp (default: library image_format)
+            compress (bool): Write the content with gzip, adding .gz to the name (default: False)
+
+        Returns:
+            str: Path of the artifact, complete after `Flush Artifacts`
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        extension = str(extension).lower().lstrip('.')
+        image_format = (image_format or self.image_format or '').lower() or None
+        if extension not in IMAGE_EXTENSIONS:
+            image_format = None
+        elif image_format and image_format not in IMAGE_FORMATS:
+            raise Failure(f"Unsupported image format '{image_format}', use one of: {', '.join(IMAGE_FORMATS)}")
+
+        digest = hashlib.sha256(content).hexdigest()
+        suffix = f".{image_format or extension}{'.gz' if compress else ''}"
+        key = (digest, suffix)
+        file_name = f"{UNSAFE_NAME_PATTERN.sub('_', str(name))}_{digest[:16]}{suffix}"
+        with self._lock:
+            self.bytes_received += len(content)
+            path = self._paths.get(key)
+            duplicate = path is not None
+            if duplicate:
+                self.duplicates += 1
+            else:
+                path = self._paths[key] = self.directory() / file_name
+                self._pending.append(self.executor().submit(self.save, content, path, image_format, compress))
+
+        self.log_link(name, path, duplicate)
+        return str(path)
+
+    @keyword('Write File Artifact')
+    def write_file_artifact(self, source, name=None, compress: bool = None, remove_source: bool = False):
+        """Write a file, e.g. a download, as an artifact in background.
+
+        Args:
+            source (str): Path of the file
+            name (str): Name of the artifact (default: name of the file without extension)
+            compress (bool): Write the content with gzip (default: True for files that are not images)
+            remove_source (bool): Delete the source file after reading it (default: False)
+
+        Returns:
+            str: Path of the artifact, complete after `Flush Artifacts`
+        """
+        source = Path(source)
+        try:
+            content = source.read_bytes()
+        except FileNotFoundError:
+            raise Failure(f"Artifact file not found: {source}")
+        extension = source.suffix.lstrip('.') or 'bin'
+        if compress is None:
+            compress = extension.lower() not in IMAGE_EXTENSIONS
+        path = self.write_artifact(content, name or source.stem, extension, compress=compress)
+        if remove_source:
+            source.unlink()
+        return path
+
+    @keyword('Flush Artifacts')
+    def flush_artifacts(self):
+        """Wait until all the artifacts are written.
+
+        Returns:
+            dict: Artifacts written, duplicates skipped and bytes received and written
+
+        Raises:
+            Failure: If an artifact could not be written
+        """
+        errors = self.wait()
+        statistics = self.statistics()
+        logger.info(self.format_statistics(statistics))
+        if errors:
+            raise Failure('Artifacts not written:\n' + '\n'.join(errors))
+        return statistics
+
+    @not_keyword
+    def directory(self):
+        if self.output_dir is None:
+            self.output_dir = Path(BuiltIn().get_variable_value('${OUTPUT DIR}', '.')) / 'artifacts'
+        return self.output_dir
+
+    @not_keyword
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='ArtifactWriter')
+        return self._executor
+
+    @not_keyword
+    def save(self, content, path, image_format, compress):
+        """Encode, compress and write an artifact, called by the worker threads."""
+        try:
+            if image_format:
+                content = self.encode_image(content, image_format)
+            if compress:
+                content = gzip.compress(content, compresslevel=6)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            temporary_path.write_bytes(content)
+            os.replace(temporary_path, path)
+        except Exception as error:
+            with self._lock:
+                self._errors.append(f"{path.name}: {error}")
+            return
+        with self._lock:
+            self.written += 1
+            self.bytes_written += len(content)
+
+    @not_keyword
+    def encode_image(self, content, image_format):
+        from PIL import Image
+
+        pillow_format, options = IMAGE_FORMATS[image_format]
+        with Image.open(BytesIO(content)) as image:
+            if pillow_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            if pillow_format != 'PNG':
+                options = dict(options, quality=self.quality)
+            output = BytesIO()
+            image.save(output, pillow_format, **options)
+        return output.getvalue()
+
+    @not_keyword
+    def log_link(self, name, path, duplicate):
+        output_dir = BuiltIn().get_variable_value('${OUTPUT DIR}', '.')
+        link = get_link_path(str(path), output_dir)
+        logger.info(f'Artifact <a href="{link}">{name}</a>{" (duplicate content)" if duplicate else ""}', html=True)
+
+    @not_keyword
+    def wait(self):
+        """Wait for the pending writes and return the errors since the last call."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    @not_keyword
+    def statistics(self):
+        return {
+            'written': self.written,
+            'duplicates': self.duplicates,
+            'bytes_received': self.bytes_received,
+            'bytes_written': self.bytes_written,
+        }
+
+    @staticmethod
+    @not_keyword
+    def format_statistics(statistics):
+        return (f"Artifacts: {statistics['written']} written, {statistics['duplicates']} duplicates skipped, "
+                f"{statistics['bytes_received'] / 2 ** 20:.2f} MiB received, "
+                f"{statistics['bytes_written'] / 2 ** 20:.2f} MiB written")
+
+    def _close(self):
+        # Library listener method, called when the execution ends. The underscore
+        # prefix keeps it from being exposed as a keyword.
+        errors = self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            logger.console(f"\n{self.format_statistics(self.statistics())} (pid {os.getpid()})")
+        for error in errors:
+            logger.console(f"Artifact not written: {error}")
@@ -0,0 +1,281 @@
+"""
+Baseline Store
+
+Pre-decoded baseline images for ``CompareTwoImages``. The builder decodes each baseline
+once and writes, in one binary file, its grayscale and RGB pixels and the SSIM statistics
+of the grayscale image (local means and variances), with a JSON index of the arrays:
+
+- ``<store>.json``: index with the offset, shape and type of each array, by image path
+- ``<store>.bin``: the arrays, read with ``numpy.memmap``
+
+The binary file is mapped read-only, so all the pabot workers of a machine share the same
+pages of the operating system cache, and no worker decodes the baselines again. The SSIM
+computed with the statistics of the store is the same as ``skimage.metrics.structural_similarity``
+with its default arguments (7x7 uniform window, sample covariance, data range of 255).
+
+A baseline changed after the store was built is detected (size, modification time and
+SHA-256 of the file) and read from the file as before.
+
+Usage:
+    # Build the store with the images of one or more folders or files
+    python resources/libraries/BaselineStore.py build resources/files/images --store reports/baselines/baselines.json
+
+    # List the images of a store
+    python resources/libraries/BaselineStore.py list --store reports/baselines/baselines.json
+
+    # Use it in the tests
+    Library    ${EXECDIR}/resources/libraries/CompareTwoImages.py    baseline_store=${EXECDIR}/reports/baselines/baselines.json
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from scipy.ndimage import uniform_filter
+
+# Parameters of the default skimage structural_similarity for uint8 images
+WINDOW_SIZE = 7
+COVARIANCE_NORM = WINDOW_SIZE ** 2 / (WINDOW_SIZE ** 2 - 1)
+DATA_RANGE = 255
+C1 = (0.01 * DATA_RANGE) ** 2
+C2 = (0.03 * DATA_RANGE) ** 2
+PAD = (WINDOW_SIZE - 1) // 2
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
+
+# Offsets of the arrays are multiples of the page size, so each array starts on its own page
+ALIGNMENT = 4096
+
+STORE_VERSION = 1
+
+
+def ssim_statistics(gray):
+    """
+    Compute the local means and variances of a grayscale image used by the SSIM.
+
+    Args:
+        gray (numpy.ndarray): Grayscale image (2D)
+
+    Returns:
+        tuple: Local means and variances (float64 arrays with the shape of the image)
+    """
+    pixels = gray.astype(np.float64)
+    means = uniform_filter(pixels, size=WINDOW_SIZE)
+    variances = COVARIANCE_NORM * (uniform_filter(pixels * pixels, size=WINDOW_SIZE) - means * means)
+    return means, variances
+
+
+def structural_similarity(gray, other, means=None, variances=None):
+    """
+    Compute the mean SSIM of two grayscale images, reusing the statistics of the first one.
+
+    Args:
+        gray (numpy.ndarray): First image, usually the baseline
+        other (numpy.ndarray): Second image, with the same shape
+        means (numpy.ndarray): Local means of the first image (default: computed)
+        variances (numpy.ndarray): Local variances of the first image (default: computed)
+
+    Returns:
+        float: Mean structural similarity, the same value as skimage structural_similarity
+
+    Raises:
+        ValueError: If the images have different shapes or are smaller than the window
+    """
+    if gray.shape != other.shape:
+        raise ValueError(f"Images must have the same dimensions: {gray.shape} != {other.shape}")
+    if min(gray.shape) < WINDOW_SIZE:
+        raise ValueError(f"Images must be at least {WINDOW_SIZE}x{WINDOW_SIZE} pixels")
+    if means is None or variances is None:
+        means, variances = ssim_statistics(gray)
+
+    pixels = other.astype(np.float64)
+    other_means, other_variances = ssim_statistics(other)
+    covariances = COVARIANCE_NORM * (uniform_filter(gray.astype(np.float64) * pixels, size=WINDOW_SIZE)
+                                     - means * other_means)
+
+    similarity = ((2 * means * other_means + C1) * (2 * covariances + C2)
+                  / ((means ** 2 + other_means ** 2 + C1) * (variances + other_variances + C2)))
+    return float(similarity[PAD:-PAD, PAD:-PAD].mean(dtype=np.float64))
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BaselineStore:
+    """Read-only access to the baselines of a store built with `build_store`.
+
+    Args:
+        index_path (str): Path of the ``<store>.json`` index
+    """
+
+    def __init__(self, index_path):
+        self.index_path = Path(index_path).resolve()
+        with open(self.index_path, encoding='utf-8') as f:
+            self.index = json.load(f)
+        if self.index.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported baseline store version {self.index.get('version')}: {index_path}")
+        self.root = (self.index_path.parent / self.index['root']).resolve()
+        data_path = self.index_path.with_suffix('.bin')
+        self.data = np.memmap(data_path, dtype=np.uint8, mode='r') if data_path.stat().st_size else None
+
+    def __contains__(self, image_source):
+        return self.key(image_source) in self.index['images']
+
+    def key(self, image_source):
+        """Return the key of an image in the index: its path relative to the root of the store."""
+        if str(image_source).startswith('http'):
+            return None
+        return Path(os.path.relpath(Path(image_source).resolve(), self.root)).as_posix()
+
+    def get(self, image_source):
+        """
+        Return the arrays of a baseline, or None if it is not in the store or changed after the build.
+
+        Args:
+            image_source (str): Path of the baseline image
+
+        Returns:
+            dict: gray, rgb, means and variances arrays (read-only views of the mapped file)
+        """
+        entry = self.index['images'].get(self.key(image_source))
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(image_source)
+        except OSError:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (entry['size'], entry['mtime_ns']):
+            if stat.st_size != entry['size'] or file_sha256(image_source) != entry['sha256']:
+                return None
+        return {name: self.array(array) for name, array in entry['arrays'].items()}
+
+    def array(self, array):
+        count = int(np.prod(array['shape']))
+        dtype = np.dtype(array['dtype'])
+        return np.frombuffer(self.data, dtype=dtype, count=count, offset=array['offset']).reshape(array['shape'])
+
+
+def find_images(sources):
+    """Return the image files of a list of files and folders (folders are searched recursively)."""
+    images = []
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            images.extend(sorted(path for path in source.rglob('*') if path.suffix.lower() in IMAGE_EXTENSIONS))
+        elif source.is_file():
+            images.append(source)
+        else:
+            raise FileNotFoundError(f"Baseline not found: {source}")
+    return images
+
+
+def build_store(sources, index_path, root=None):
+    """
+    Decode the baseline images and write the store.
+
+    The files are written with temporary names and renamed at the end, so workers that
+    are reading the previous store are not affected.
+
+    Args:
+        sources (list): Image files and folders of images
+        index_path (str): Path of the ``<store>.json`` index, the data goes to ``<store>.bin``
+        root (str): Directory the image keys are relative to (default: current directory)
+
+    Returns:
+        dict: The index of the store
+    """
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    root = Path(root or '.').resolve()
+    data_path = index_path.with_suffix('.bin')
+    temporary_data = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+    temporary_index = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+
+    index = {
+        'version': STORE_VERSION,
+        'root': os.path.relpath(root, index_path.resolve().parent),
+        'window_size': WINDOW_SIZE,
+        'images': {},
+    }
+    offset = 0
+    with open(temporary_data, 'wb') as data:
+        for image_path in find_images(sources):
+            with Image.open(image_path) as image:
+                gray = np.asarray(image.convert('L'))
+                rgb = np.asarray(image.convert('RGB'))
+            means, variances = ssim_statistics(gray)
+
+            arrays = {}
+            for name, array in (('gray', gray), ('rgb', rgb), ('means', means), ('variances', variances)):
+                padding = -offset % ALIGNMENT
+                data.write(b'\0' * padding)
+                offset += padding
+                data.write(np.ascontiguousarray(array).tobytes())
+                arrays[name] = {'offset': offset, 'shape': list(array.shape), 'dtype': array.dtype.str}
+                offset += array.nbytes
+
+            stat = image_path.stat()
+            key = Path(os.path.relpath(image_path.resolve(), root)).as_posix()
+            index['images'][key] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': file_sha256(image_path),
+                'arrays': arrays,
+            }
+
+    with open(temporary_index, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    os.replace(temporary_data, data_path)
+    os.replace(temporary_index, index_path)
+    return index
+
+
+def main():
+    """
+    Main function for command-line execution.
+
+    Command-line arguments:
+        command: build or list
+        sources: Image files and folders of the baselines (build)
+        --store: Path of the store index (default: reports/baselines/baselines.json)
+        --root: Directory the image keys are relative to (default: current directory)
+
+    Example usage:
+        python BaselineStore.py build resources/files/images --store reports/baselines/baselines.json
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Baseline Store of CompareTwoImages')
+    parser.add_argument('command', choices=['build', 'list'], help='Command to execute')
+    parser.add_argument('sources', nargs='*', help='Image files and folders of the baselines')
+    parser.add_argument('--store', default='reports/baselines/baselines.json',
+                        help='Path of the store index (default: reports/baselines/baselines.json)')
+    parser.add_argument('--root', default=None,
+                        help='Directory the image keys are relative to (default: current directory)')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        if not args.sources:
+            parser.error('build needs at least one image file or folder')
+        index = build_store(args.sources, args.store, args.root)
+        size = Path(args.store).with_suffix('.bin').stat().st_size
+        print(f"{len(index['images'])} baselines ({size / 2 ** 20:.1f} MiB) saved to: {args.store}")
+    else:
+        store = BaselineStore(args.store)
+        for key, entry in store.index['images'].items():
+            height, width = entry['arrays']['gray']['shape']
+            print(f"{key} ({width}x{height})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+import math
+import threading
+import uuid
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+import requests
+from requests.adapters import HTTPAdapter
+from robot.api import Failure, logger
+from robot.api.deco import keyword, not_keyword
+
+DEFAULT_PASSWORD = 'Asasda!123456'
+
+# Upper limits (in milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class BookStoreClient:
+    """Library to send concurrent requests to the Book Store API.
+
+    Requests are sent by a thread pool through a single HTTP session with keep-alive
+    connection pooling, so batches of requests reuse the same connections. Batch keywords
+    fan out the requests with a concurrency limit and return the results in the same order
+    as the input.
+
+    The latency of every request is recorded by endpoint and can be read as percentiles and
+    histograms, which makes the library usable to load-test the endpoints.
+
+    = Usage =
+
+    | ${books}=         | List Books By ISBN Batch | 9781449365035     | 9781449325862 |
+    | ${users}=         | Create Users Batch       | 10                |               |
+    | Generate Tokens Batch | ${users}             |                   |               |
+    | Delete Users Batch    | ${users}             |                   |               |
+    | ${stats}=         | Run Load Test            | GET               | /BookStore/v1/Books | total_requests=200 | concurrency=20 |
+    | Log Latency Histogram |                      |                   |               |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self, base_url='https://demoqa.com', concurrency=8, timeout=30, verify=True):
+        """Initialize the BookStoreClient library.
+
+        Args:
+            base_url (str): Book Store API URL (default: https://demoqa.com)
+            concurrency (int): Maximum number of parallel requests (default: 8)
+            timeout (float): Timeout of each request in seconds (default: 30)
+            verify (bool): Verify the TLS certificates (default: True)
+        """
+        self.base_url = str(base_url).rstrip('/')
+        self.concurrency = int(concurrency)
+        self.timeout = float(timeout)
+        self.verify = verify
+        self._session = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self.latencies = {}
+
+    @not_keyword
+    def session(self):
+        """Return the HTTP session, creating it with a connection pool of `concurrency` connections."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({'accept': 'application/json', 'Content-Type': 'application/json'})
+            session.verify = self.verify
+            self._session = session
+        return self._session
+
+    @not_keyword
+    def request(self, method, path, expected_status=None, endpoint=None, **kwargs):
+        """Send a request and record its latency.
+
+        Args:
+            method (str): HTTP method
+            path (str): Path of the resource, relative to base_url
+            expected_status (int): Expected status code, fails if different (default: no validation)
+            endpoint (str): Name used in the latency statistics (default: method and path)
+            **kwargs: Arguments passed to requests (json, params, headers...)
+
+        Returns:
+            requests.Response: API response
+
+        Raises:
+            Failure: If the status code is not the expected one
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        start = perf_counter()
+        response = self.session().request(method, f'{self.base_url}{path}', **kwargs)
+        self.record_latency(endpoint or f'{method.upper()} {path}', (perf_counter() - start) * 1000)
+
+        if expected_status is not None and response.status_code != int(expected_status):
+            raise Failure(f"{method.upper()} {path} returned status {response.status_code}, "
+                          f"expected {expected_status}: {response.text[:200]}")
+        return response
+
+    @not_keyword
+    def fan_out(self, function, items, concurrency=None):
+        """Call a function for each item using the thread pool.
+
+        Args:
+            function (callable): Function called with each item
+            items (list): Items to process
+            concurrency (int): Maximum number of items processed at the same time (default: library concurrency)
+
+        Returns:
+            list: Results in the same order as the items
+
+        Raises:
+            Failure: If any call fails, with the errors of all failed items
+        """
+        items = list(items)
+        if not items:
+            return []
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency,
+                                                thread_name_prefix='BookStoreClient')
+        limit = threading.Semaphore(min(int(concurrency or self.concurrency), self.concurrency))
+
+        def limited(item):
+            with limit:
+                return function(item)
+
+        futures = [self._executor.submit(limited, item) for item in items]
+        results = []
+        errors = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as error:
+                errors.append(f'{item}: {error}')
+        if errors:
+            raise Failure(f"{len(errors)} of {len(items)} requests failed:\n" + '\n'.join(errors[:10]))
+        return results
+
+    @keyword('List Books By ISBN Batch')
+    def list_books_by_isbn_batch(self, *isbns, concurrency=None):
+        """Retrieve several books by ISBN in parallel.
+
+        Args:
+            isbns (list): ISBNs of the books
+            concurrency (int): Maximum number of parallel requests (default: library concurrency)
+
+        Returns:
+            list: Book details, in the same order as the ISBNs
+        """
+        return self.fan_out(
+            lambda isbn: self.request('GET', '/BookStore/v1/Book', 200, 'GET /BookStore/v1/Book',
+                                      params={'ISBN': isbn}).json(),
+            isbns, concurrency)
+
+    @keyword('Create Users Batch')
+    def create_users_batch(self, count, password=DEFAULT_PASSWORD, prefix='user', concurrency=None):
+        """Create several user accounts in parallel.
+
+        Args:
+            count (int): Number of users to create
+            password (str): Password of the users (default: a password accepted by the API)
+            prefix (str): Prefix of the generated user names (default: user)
+            concurrency (int): Maximum number of parallel requests (default: library concurrency)
+
+        Returns:
+            list: Dictionaries with userName, password and userID of each user
+        """
+        def create(user):
+            response = self.request('POST', '/Account/v1/User', 201, json=user)
+            user['userID'] = response.json()['userID']
+            return user
+
+        users = [{'userName': f'{prefix}_{uuid.uuid4().hex[:12]}', 'password': password}
+                 for _ in range(int(count))]
+        return self.fan_out(create, users, concurrency)
+
+    @keyword('Generate Tokens Batch')
+    def generate_tokens_batch(self, users, concurrency=None):
+        """Generate the authentication tokens of several users in parallel.
+
+        The token and its expiration date are added to each user dictionary.
+
+        Args:
+            users (list): Dictionaries with userName and password
+            concurrency (int): Maximum number of parallel requests (default: library concurrency)
+
+        Returns:
+            list: The same user dictionaries, with token and expires
+        """
+        def generate(user):
+            response = self.request('POST', '/Account/v1/GenerateToken', 200,
+                                    json={'userName': user['userName'], 'password': user['password']})
+            result = response.json()
+            if result.get('status') != 'Success':
+                raise Failure(f"Token not generated for {user['userName']}: {result.get('result')}")
+            user['token'] = result['token']
+            user['expires'] = result['expires']
+            return user
+
+        return self.fan_out(generate, users, concurrency)
+
+    @keyword('Delete Users Batch')
+    def delete_users_batch(self, users, concurrency=None):
+        """Delete several user accounts in parallel.
+
+        Args:
+            users (list): Dictionaries with userID and token of each user
+            concurrency (int): Maximum number of parallel requests (default: library concurrency)
+        """
+        def delete(user):
+            self.request('DELETE', f"/Account/v1/User/{user['userID']}", 204, 'DELETE /Account/v1/User',
+                         headers={'Authorization': f"Bearer {user['token']}"})
+
+        self.fan_out(delete, users, concurrency)
+
+    @keyword('Run Load Test')
+    def run_load_test(self, method, path, total_requests=100, concurrency=None, body=None, expected_status=200):
+        """Send the same request many times in parallel and return its latency statistics.
+
+        Args:
+            method (str): HTTP method
+            path (str): Path of the resource, relative to the base URL
+            total_requests (int): Number of requests to send (default: 100)
+            concurrency (int): Maximum number of parallel requests (default: library concurrency)
+            body (dict): JSON body of the request (default: no body)
+            expected_status (int): Expected status code of every request (default: 200)
+
+        Returns:
+            dict: Latency statistics of the endpoint (see `Get Latency Statistics`)
+        """
+        endpoint = f'{method.upper()} {path}'
+        with self._lock:
+            self.latencies.pop(endpoint, None)
+        start = perf_counter()
+        self.fan_out(lambda _: self.request(method, path, expected_status, endpoint, json=body),
+                     range(int(total_requests)), concurrency)
+        elapsed = perf_counter() - start
+
+        statistics = self.get_latency_statistics()[endpoint]
+        statistics['throughput'] = round(int(total_requests) / elapsed, 2) if elapsed else 0.0
+        logger.info(f"{endpoint}: {total_requests} requests in {elapsed:.2f}s ({statistics['throughput']} req/s)")
+        return statistics
+
+    @not_keyword
+    def record_latency(self, endpoint, milliseconds):
+        with self._lock:
+            self.latencies.setdefault(endpoint, []).append(milliseconds)
+
+    @keyword('Get Latency Statistics')
+    def get_latency_statistics(self):
+        """Return the latency statistics of every endpoint called by the library.
+
+        Returns:
+            dict: By endpoint, the count, min, average, p50, p90, p99 and max latency in milliseconds
+            and a histogram with the number of requests by bucket (upper limit in ms)
+        """
+        with self._lock:
+            latencies = {endpoint: sorted(samples) for endpoint, samples in self.latencies.items()}
+
+        statistics = {}
+        for endpoint, samples in latencies.items():
+            histogram = {f'<={limit}': 0 for limit in LATENCY_BUCKETS_MS}
+            histogram[f'>{LATENCY_BUCKETS_MS[-1]}'] = 0
+            for sample in samples:
+                index = bisect_left(LATENCY_BUCKETS_MS, sample)
+                label = f'<={LATENCY_BUCKETS_MS[index]}' if index < len(LATENCY_BUCKETS_MS) \
+                    else f'>{LATENCY_BUCKETS_MS[-1]}'
+                histogram[label] += 1
+            statistics[endpoint] = {
+                'count': len(samples),
+                'min': round(samples[0], 2),
+                'average': round(sum(samples) / len(samples), 2),
+                'p50': round(percentile(samples, 50), 2),
+                'p90': round(percentile(samples, 90), 2),
+                'p99': round(percentile(samples, 99), 2),
+                'max': round(samples[-1], 2),
+                'histogram': histogram,
+            }
+        return statistics
+
+    @keyword('Log Latency Histogram')
+    def log_latency_histogram(self):
+        """Log the latency percentiles and histogram of every endpoint called by the library."""
+        for endpoint, stats in self.get_latency_statistics().items():
+            lines = [f"{endpoint}: {stats['count']} requests, p50={stats['p50']}ms, "
+                     f"p90={stats['p90']}ms, p99={stats['p99']}ms, max={stats['max']}ms"]
+            largest = max(stats['histogram'].values()) or 1
+            for label, count in stats['histogram'].items():
+                lines.append(f"  {label:>8} ms | {'#' * round(40 * count / largest):<40} {count}")
+            logger.info('\n'.join(lines))
+
+    @keyword('Reset Latency Statistics')
+    def reset_latency_statistics(self):
+        """Discard the latencies recorded until now."""
+        with self._lock:
+            self.latencies = {}
+
+
+def percentile(sorted_samples, percent):
+    """Return a percentile of a sorted list using the nearest-rank method.
+
+    Args:
+        sorted_samples (list): Sorted samples
+        percent (float): Percentile between 0 and 100
+
+    Returns:
+        float: Value of the percentile
+    """
+    rank = max(math.ceil(percent / 100 * len(sorted_samples)) - 1, 0)
+    return sorted_samples[min(rank, len(sorted_samples) - 1)]
@@ -0,0 +1,369 @@
+"""
+Book Store Stub Server
+
+Local stand-in for the demoqa.com Book Store API, used to run the API suites offline
+and at local-loopback speed. It implements the endpoints used by
+bookStore.keywords.resource and has three modes:
+
+- stub: in-memory implementation of /Account/v1/* and /BookStore/v1/*, serving the books
+  of the jsonSchema fixtures (listBooks.json and listBookISBN.json)
+- record: proxy that forwards every request to the real API and saves the responses in a
+  fixture store (a compact JSON file)
+- replay: serves the responses saved in the fixture store
+
+Usage:
+    python resources/libraries/BookStoreStub.py --port 8087
+    python resources/libraries/BookStoreStub.py --port 8087 --mode record --upstream https://demoqa.com
+    robot -v DEMOQA_URL:http://127.0.0.1:8087 tests/Examples/api.robot
+
+The server can also be started from Robot Framework with `Start Book Store Stub`.
+"""
+
+import hashlib
+import json
+import os
+import re
+import secrets
+import sys
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+import requests
+from robot.api import logger
+from robot.api.deco import keyword
+
+RESOURCES_FILES = Path(__file__).resolve().parents[1] / 'files'
+DEFAULT_STORE = RESOURCES_FILES / 'json' / 'book_store_fixtures.json'
+MODES = ('stub', 'record', 'replay')
+
+PASSWORD_RULE = re.compile(r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[^a-zA-Z\d]).{8,}$')
+PASSWORD_MESSAGE = ("Passwords must have at least one non alphanumeric character, one digit ('0'-'9'), "
+                    "one uppercase ('A'-'Z'), one lowercase ('a'-'z'), one special character and "
+                    "Password must be eight characters or longer.")
+
+# Request headers forwarded to the real API in record mode
+FORWARDED_HEADERS = ('accept', 'content-type', 'authorization')
+
+
+def load_books():
+    """
+    Load the books served by the stub from the jsonSchema fixtures.
+
+    Returns:
+        list: Book dictionaries, the same data returned by the real API
+    """
+    books = {}
+    for schema_name, extract in [('listBooks.json', lambda example: example['books']),
+                                 ('listBookISBN.json', lambda example: [example])]:
+        with open(RESOURCES_FILES / 'jsonSchema' / schema_name, encoding='utf-8') as schema_file:
+            schema = json.load(schema_file)
+        for example in schema.get('examples', []):
+            for book in extract(example):
+                books.setdefault(book['isbn'], book)
+    return list(books.values())
+
+
+class BookStoreState:
+    """In-memory users, tokens and books of the stub mode."""
+
+    def __init__(self, books=None):
+        self.books = books if books is not None else load_books()
+        self.books_by_isbn = {book['isbn']: book for book in self.books}
+        self.users = {}
+        self.user_ids = {}
+        self.tokens = {}
+        self.lock = threading.Lock()
+
+    def handle(self, method, path, query, body, headers):
+        """
+        Answer a request like the real Book Store API.
+
+        Returns:
+            tuple: (status code, response body as a JSON-serializable object or None)
+        """
+        if method == 'GET' and path == '/BookStore/v1/Books':
+            return 200, {'books': self.books}
+        if method == 'GET' and path == '/BookStore/v1/Book':
+            book = self.books_by_isbn.get(query.get('ISBN', [''])[0])
+            if book is None:
+                return 400, {'code': '1205', 'message': 'ISBN supplied is not available in Books Collection!'}
+            return 200, book
+
+        if method == 'POST' and path in ('/Account/v1/User', '/Account/v1/GenerateToken', '/Account/v1/Authorized'):
+            user_name = (body or {}).get('userName')
+            password = (body or {}).get('password')
+            if not user_name or not password:
+                return 400, {'code': '1200', 'message': 'UserName and Password required.'}
+            with self.lock:
+                if path == '/Account/v1/User':
+                    return self._create_user(user_name, password)
+                if path == '/Account/v1/GenerateToken':
+                    return self._generate_token(user_name, password)
+                return self._authorized(user_name, password)
+
+        match = re.fullmatch(r'/Account/v1/User/([^/]+)', path)
+        if match and method in ('GET', 'DELETE'):
+            with self.lock:
+                return self._user_by_id(method, match.group(1), headers.get('authorization', ''))
+
+        return 404, {'code': '404', 'message': f'Endpoint not found: {method} {path}'}
+
+    def _create_user(self, user_name, password):
+        if user_name in self.user_ids:
+            return 406, {'code': '1204', 'message': 'User exists!'}
+        if not PASSWORD_RULE.match(password):
+            return 400, {'code': '1300', 'message': PASSWORD_MESSAGE}
+        user_id = str(uuid.uuid4())
+        self.users[user_id] = {'userID': user_id, 'username': user_name, 'password': password,
+                               'books': [], 'token': None}
+        self.user_ids[user_name] = user_id
+        return 201, {'userID': user_id, 'username': user_name, 'books': []}
+
+    def _generate_token(self, user_name, password):
+        user = self.users.get(self.user_ids.get(user_name))
+        if user is None or user['password'] != password:
+            return 200, {'token': None, 'expires': None, 'status': 'Failed',
+                         'result': 'User authorization failed.'}
+        self.tokens.pop(user['token'], None)
+        user['token'] = secrets.token_urlsafe(32)
+        self.tokens[user['token']] = user['userID']
+        expires = datetime.now(timezone.utc) + timedelta(days=7)
+        return 200, {'token': user['token'], 'expires': expires.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
+                     'status': 'Success', 'result': 'User authorized successfully.'}
+
+    def _authorized(self, user_name, password):
+        user = self.users.get(self.user_ids.get(user_name))
+        if user is None or user['password'] != password:
+            return 404, {'code': '1207', 'message': 'User not found!'}
+        return 200, user['token'] is not None
+
+    def _user_by_id(self, method, user_id, authorization):
+        token = authorization.split(' ', 1)[-1]
+        if self.tokens.get(token) != user_id:
+            return 401, {'code': '1200', 'message': 'User not authorized!'}
+        user = self.users[user_id]
+        if method == 'GET':
+            return 200, {'userId': user_id, 'username': user['username'], 'books': user['books']}
+        del self.users[user_id]
+        del self.user_ids[user['username']]
+        del self.tokens[token]
+        return 204, None
+
+
+class FixtureStore:
+    """
+    Recorded responses of the real API, saved in a compact JSON file.
+
+    Responses are keyed by method, path with query string and a hash of the request body.
+    When replaying a request whose body was never recorded (e.g. a new random user name),
+    the last response recorded for the same method and path is used.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.responses = {}
+        self.latest = {}
+        self.lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as store_file:
+                data = json.load(store_file)
+            self.responses = data.get('responses', {})
+            self.latest = data.get('latest', {})
+
+    @staticmethod
+    def key(method, target, body):
+        digest = hashlib.sha1(body or b'').hexdigest()[:12]
+        return f'{method} {target} {digest}'
+
+    def get(self, method, target, body):
+        with self.lock:
+            response = self.responses.get(self.key(method, target, body))
+            if response is None:
+                response = self.responses.get(self.latest.get(f'{method} {target}'))
+            return response
+
+    def put(self, method, target, body, response):
+        key = self.key(method, target, body)
+        with self.lock:
+            self.responses[key] = response
+            self.latest[f'{method} {target}'] = key
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = self.path.with_suffix('.tmp')
+            with open(temporary_path, 'w', encoding='utf-8') as store_file:
+                json.dump({'responses': self.responses, 'latest': self.latest}, store_file,
+                          separators=(',', ':'), sort_keys=True)
+            os.replace(temporary_path, self.path)
+
+
+class BookStoreRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler that dispatches the requests to the mode of the server."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def do_DELETE(self):
+        self._dispatch()
+
+    def log_message(self, format, *args):
+        # Keep the console clean, the stub can serve thousands of requests per run
+        pass
+
+    def _dispatch(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        server = self.server
+
+        if server.mode == 'stub':
+            try:
+                body = json.loads(raw_body) if raw_body else None
+            except ValueError:
+                body = None
+            split = urlsplit(self.path)
+            status, payload = server.state.handle(self.command, split.path, parse_qs(split.query),
+                                                  body, headers)
+            content = b'' if payload is None else json.dumps(payload).encode('utf-8')
+            self._send(status, 'application/json; charset=utf-8', content)
+        elif server.mode == 'record':
+            response = requests.request(
+                self.command, f'{server.upstream}{self.path}', data=raw_body or None, timeout=60,
+                headers={name: value for name, value in headers.items() if name in FORWARDED_HEADERS})
+            recorded = {'status': response.status_code,
+                        'content_type': response.headers.get('Content-Type', 'application/json'),
+                        'body': response.text}
+            server.store.put(self.command, self.path, raw_body, recorded)
+            self._send(recorded['status'], recorded['content_type'], response.content)
+        else:
+            recorded = server.store.get(self.command, self.path, raw_body)
+            if recorded is None:
+                message = {'code': '404', 'message': f'No recorded response for {self.command} {self.path}'}
+                self._send(404, 'application/json', json.dumps(message).encode('utf-8'))
+            else:
+                self._send(recorded['status'], recorded['content_type'], recorded['body'].encode('utf-8'))
+
+    def _send(self, status, content_type, content):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def create_server(host='127.0.0.1', port=8087, mode='stub', store=DEFAULT_STORE, upstream='https://demoqa.com'):
+    """
+    Create the stub HTTP server (not started).
+
+    Args:
+        host (str): Interface to listen on (default: 127.0.0.1)
+        port (int): Port to listen on, 0 chooses a free port (default: 8087)
+        mode (str): stub, record or replay (default: stub)
+        store (str): Fixture store file used by record and replay (default: resources/files/json/book_store_fixtures.json)
+        upstream (str): Real API URL used by record (default: https://demoqa.com)
+
+    Returns:
+        ThreadingHTTPServer: Server ready to serve_forever
+    """
+    if mode not in MODES:
+        raise ValueError(f"Invalid mode '{mode}', expected one of: {', '.join(MODES)}")
+    server = ThreadingHTTPServer((host, int(port)), BookStoreRequestHandler)
+    server.daemon_threads = True
+    server.mode = mode
+    server.upstream = str(upstream).rstrip('/')
+    server.state = BookStoreState() if mode == 'stub' else None
+    server.store = FixtureStore(store) if mode != 'stub' else None
+    return server
+
+
+class BookStoreStub:
+    """Library to start and stop the local Book Store stand-in server from a suite.
+
+    = Usage =
+
+    | ${url}=    | Start Book Store Stub | port=0 |
+    | Create Session | ${SESSION} | ${url} |
+    | Stop Book Store Stub |  |  |
+
+    To run the existing suites against the stand-in, start the server from the command line
+    and override DEMOQA_URL: ``robot -v DEMOQA_URL:http://127.0.0.1:8087 tests/Examples/api.robot``
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        """Initialize the BookStoreStub library."""
+        self.server = None
+
+    @keyword('Start Book Store Stub')
+    def start_book_store_stub(self, port=0, mode='stub', store=str(DEFAULT_STORE), upstream='https://demoqa.com'):
+        """Start the stand-in server in a background thread.
+
+        Args:
+            port (int): Port to listen on, 0 chooses a free port (default: 0)
+            mode (str): stub, record or replay (default: stub)
+            store (str): Fixture store file used by record and replay modes
+            upstream (str): Real API URL used by record mode (default: https://demoqa.com)
+
+        Returns:
+            str: Base URL of the server, to be used as DEMOQA_URL
+        """
+        self.stop_book_store_stub()
+        self.server = create_server('127.0.0.1', port, mode, store, upstream)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        logger.info(f"Book Store stub started in {mode} mode: {url}")
+        return url
+
+    @keyword('Stop Book Store Stub')
+    def stop_book_store_stub(self):
+        """Stop the stand-in server, if it is running."""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def main():
+    """
+    Main function for command-line execution.
+
+    Command-line arguments:
+        --host: Interface to listen on (default: 127.0.0.1)
+        --port: Port to listen on (default: 8087)
+        --mode: stub, record or replay (default: stub)
+        --store: Fixture store file used by record and replay
+        --upstream: Real API URL used by record (default: https://demoqa.com)
+
+    Example usage:
+        python BookStoreStub.py --port 8087 --mode replay
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Local Book Store API stand-in server')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8087, help='Port to listen on (default: 8087)')
+    parser.add_argument('--mode', choices=MODES, default='stub', help='Server mode (default: stub)')
+    parser.add_argument('--store', default=str(DEFAULT_STORE), help='Fixture store file for record and replay')
+    parser.add_argument('--upstream', default='https://demoqa.com', help='Real API URL used by record')
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.mode, args.store, args.upstream)
+    print(f"Book Store stub running in {args.mode} mode on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
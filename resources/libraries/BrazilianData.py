@@ -0,0 +1,297 @@
+import csv
+import json
+import string
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+from robot.api.deco import keyword, not_keyword
+
+DDD_FILE = Path(__file__).resolve().parents[1] / 'files' / 'json' / 'ddd_brasil.json'
+
+LETTERS = np.frombuffer(string.ascii_letters.encode('ascii'), dtype=np.uint8)
+
+# Weights of the CPF and CNPJ check digits (modulo 11)
+CPF_WEIGHTS = (np.arange(10, 1, -1), np.arange(11, 1, -1))
+CNPJ_WEIGHTS = (np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]), np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+
+# Masks used to render the values, each '#' is replaced by one digit
+CELL_PHONE_MASK = '(##) 99###-####'
+LANDLINE_MASK = '(##) 3###-####'
+CPF_MASK = '###.###.###-##'
+CNPJ_MASK = '##.###.###/####-##'
+
+# Positions of the characters of an ISO date (YYYY-MM-DD) in a pt-BR date (DD-MM-YYYY)
+PT_BR_DATE_ORDER = [8, 9, 7, 5, 6, 4, 0, 1, 2, 3]
+
+
+@lru_cache(maxsize=None)
+def load_ddd_table(file_path=DDD_FILE):
+    """Load the Brazilian area codes (DDD) once per process.
+
+    Args:
+        file_path (Path): JSON file with the estadoPorDdd dictionary
+
+    Returns:
+        numpy.ndarray: Area codes as integers
+    """
+    with open(file_path, encoding='utf-8') as ddd_file:
+        return np.array(sorted(int(ddd) for ddd in json.load(ddd_file)['estadoPorDdd']), dtype=np.int64)
+
+
+def render_digits(digits, mask):
+    """Render rows of digits as strings using a mask.
+
+    Args:
+        digits (numpy.ndarray): Matrix with one row of digits per value
+        mask (str): Mask of the values, each '#' receives the next digit of the row
+
+    Returns:
+        list: One string per row
+    """
+    template = np.frombuffer(mask.encode('ascii'), dtype=np.uint8)
+    slots = np.flatnonzero(template == ord('#'))
+    characters = np.tile(template, (len(digits), 1))
+    characters[:, slots] = digits + ord('0')
+    return characters_to_strings(characters)
+
+
+def characters_to_strings(characters):
+    """Convert a matrix of ASCII codes to a list of strings, one per row."""
+    characters = np.ascontiguousarray(characters, dtype=np.uint8)
+    return characters.view(f'S{characters.shape[1]}').ravel().astype(str).tolist()
+
+
+def add_check_digits(base, weights):
+    """Append the modulo 11 check digits of CPF/CNPJ to each row.
+
+    Args:
+        base (numpy.ndarray): Matrix with the digits without the check digits
+        weights (tuple): Weights of the first and of the second check digit
+
+    Returns:
+        numpy.ndarray: Matrix with the two check digits appended
+    """
+    digits = base
+    for weight in weights:
+        remainder = (digits @ weight) % 11
+        check_digit = np.where(remainder < 2, 0, 11 - remainder)
+        digits = np.column_stack((digits, check_digit))
+    return digits
+
+
+def subtract_years(day, years):
+    """Return the same day some years before, using 28/02 for 29/02 in non-leap years."""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+class BrazilianData:
+    """Library to generate Brazilian test data in bulk.
+
+    Every value comes from a NumPy random generator and is drawn in batches, so generating
+    a single value or 100k values costs about the same number of Python calls. The DDD
+    table is loaded once per process. Use a seed to generate the same data on every run.
+
+    = Usage =
+
+    | ${cpfs}=      | Generate CPFs                | 1000    | formatted=True |
+    | ${phones}=    | Generate Cell Phone Numbers  | 1000    |                |
+    | ${records}=   | Generate Brazilian Records   | 100000  |                |
+    | Set Data Seed | 42                           |         |                |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self, seed=None):
+        """Initialize the BrazilianData library.
+
+        Args:
+            seed (int): Seed of the random generator (default: random seed)
+        """
+        self.set_data_seed(seed)
+
+    @keyword('Set Data Seed')
+    def set_data_seed(self, seed=None):
+        """Restart the random generator with a seed, to generate reproducible data.
+
+        Args:
+            seed (int): Seed of the random generator (default: random seed)
+        """
+        self.rng = np.random.default_rng(None if seed in (None, '') else int(seed))
+
+    @not_keyword
+    def random_digits(self, count, size):
+        return self.rng.integers(0, 10, size=(int(count), size))
+
+    @not_keyword
+    def random_ddds(self, count):
+        table = load_ddd_table()
+        ddds = table[self.rng.integers(0, len(table), size=int(count))]
+        return np.column_stack((ddds // 10, ddds % 10))
+
+    @keyword('Generate DDDs')
+    def generate_ddds(self, count=1):
+        """Generate Brazilian area codes (DDD) from ddd_brasil.json.
+
+        Args:
+            count (int): Number of values (default: 1)
+
+        Returns:
+            list: Area codes as strings, e.g. 19
+        """
+        return render_digits(self.random_ddds(count), '##')
+
+    @keyword('Generate Cell Phone Numbers')
+    def generate_cell_phone_numbers(self, count=1):
+        """Generate Brazilian cell phone numbers, e.g. (64) 99595-3867.
+
+        Args:
+            count (int): Number of values (default: 1)
+
+        Returns:
+            list: Formatted cell phone numbers
+        """
+        digits = np.column_stack((self.random_ddds(count), self.random_digits(count, 7)))
+        return render_digits(digits, CELL_PHONE_MASK)
+
+    @keyword('Generate Landline Numbers')
+    def generate_landline_numbers(self, count=1):
+        """Generate Brazilian landline numbers, e.g. (22) 3981-3969.
+
+        Args:
+            count (int): Number of values (default: 1)
+
+        Returns:
+            list: Formatted landline numbers
+        """
+        digits = np.column_stack((self.random_ddds(count), self.random_digits(count, 7)))
+        return render_digits(digits, LANDLINE_MASK)
+
+    @keyword('Generate CPFs')
+    def generate_cpfs(self, count=1, formatted=False):
+        """Generate CPF numbers with valid check digits.
+
+        Args:
+            count (int): Number of values (default: 1)
+            formatted (bool): Return as XXX.XXX.XXX-XX instead of only digits (default: False)
+
+        Returns:
+            list: CPF numbers
+        """
+        base = self.random_digits(count, 9)
+        # CPFs with all digits equal are invalid
+        repeated = (base == base[:, :1]).all(axis=1)
+        while repeated.any():
+            base[repeated] = self.random_digits(repeated.sum(), 9)
+            repeated = (base == base[:, :1]).all(axis=1)
+        return render_digits(add_check_digits(base, CPF_WEIGHTS), CPF_MASK if formatted else '#' * 11)
+
+    @keyword('Generate CNPJs')
+    def generate_cnpjs(self, count=1, formatted=False):
+        """Generate CNPJ numbers of head offices (branch 0001) with valid check digits.
+
+        Args:
+            count (int): Number of values (default: 1)
+            formatted (bool): Return as XX.XXX.XXX/XXXX-XX instead of only digits (default: False)
+
+        Returns:
+            list: CNPJ numbers
+        """
+        base = np.column_stack((self.random_digits(count, 8), np.tile([0, 0, 0, 1], (int(count), 1))))
+        return render_digits(add_check_digits(base, CNPJ_WEIGHTS), CNPJ_MASK if formatted else '#' * 14)
+
+    @keyword('Generate Dates Of Birth')
+    def generate_dates_of_birth(self, count=1, min_age=18, max_age=100):
+        """Generate dates of birth in pt-BR format (DD-MM-YYYY) for an age range.
+
+        Args:
+            count (int): Number of values (default: 1)
+            min_age (int): Minimum age (default: 18)
+            max_age (int): Maximum age (default: 100)
+
+        Returns:
+            list: Dates in DD-MM-YYYY format
+        """
+        today = date.today()
+        first = subtract_years(today, int(max_age) + 1).toordinal() + 1
+        last = subtract_years(today, int(min_age)).toordinal()
+        ordinals = self.rng.integers(first, last + 1, size=int(count))
+        days = (ordinals - date(1970, 1, 1).toordinal()).astype('datetime64[D]')
+        iso_dates = np.datetime_as_string(days).astype('S10')
+        characters = iso_dates.view(np.uint8).reshape(-1, 10)[:, PT_BR_DATE_ORDER]
+        return characters_to_strings(characters)
+
+    @keyword('Generate Letter Strings')
+    def generate_letter_strings(self, count=1, length=8):
+        """Generate strings of random ASCII letters (upper and lower case).
+
+        Args:
+            count (int): Number of values (default: 1)
+            length (int): Number of letters of each string (default: 8)
+
+        Returns:
+            list: Strings of letters
+        """
+        if int(length) <= 0:
+            return [''] * int(count)
+        return characters_to_strings(LETTERS[self.rng.integers(0, len(LETTERS), size=(int(count), int(length)))])
+
+    @keyword('Generate Brazilian Records')
+    def generate_brazilian_records(self, count=1, formatted=True):
+        """Generate records with CPF, CNPJ, cell phone, landline and date of birth.
+
+        Args:
+            count (int): Number of records (default: 1)
+            formatted (bool): Format the CPF and CNPJ (default: True)
+
+        Returns:
+            list: Dictionaries with cpf, cnpj, cell_phone, landline and birth_date
+        """
+        columns = {
+            'cpf': self.generate_cpfs(count, formatted),
+            'cnpj': self.generate_cnpjs(count, formatted),
+            'cell_phone': self.generate_cell_phone_numbers(count),
+            'landline': self.generate_landline_numbers(count),
+            'birth_date': self.generate_dates_of_birth(count),
+        }
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    @keyword('Write Brazilian Records To CSV')
+    def write_brazilian_records_to_csv(self, file_path, count, formatted=True, delimiter=';'):
+        """Write generated records to a CSV file in the DataDriver format.
+
+        The first column is the test case name and the others are the ${variables}
+        of the template test, e.g. ``*** Test Cases ***;${cpf};${cnpj};...``
+
+        Args:
+            file_path (str): Path of the CSV file
+            count (int): Number of records
+            formatted (bool): Format the CPF and CNPJ (default: True)
+            delimiter (str): Column delimiter (default: ;)
+
+        Returns:
+            str: Path of the CSV file
+        """
+        records = self.generate_brazilian_records(count, formatted)
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8', newline='') as csv_file:
+            writer = csv.writer(csv_file, delimiter=delimiter)
+            writer.writerow(['*** Test Cases ***'] + [f'${{{name}}}' for name in records[0]] if records else [])
+            writer.writerows([f'Record {index}'] + list(record.values())
+                             for index, record in enumerate(records, start=1))
+        return str(file_path)
+
+    @keyword('Format CPF')
+    def format_cpf(self, cpf):
+        """Format a CPF number (11 digits) as XXX.XXX.XXX-XX."""
+        cpf = str(cpf)
+        return f'{cpf[0:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:11]}'
+
+    @keyword('Format CNPJ')
+    def format_cnpj(self, cnpj):
+        """Format a CNPJ number (14 digits) as XX.XXX.XXX/XXXX-XX."""
+        cnpj = str(cnpj)
+        return f'{cnpj[0:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:14]}'
@@ -0,0 +1,157 @@
+import os
+from time import perf_counter
+from robot.api import logger
+from robot.api.deco import keyword, not_keyword
+from robot.libraries.BuiltIn import BuiltIn
+
+
+class BrowserPool:
+    """Library to keep one browser open per process and reuse it between tests.
+
+    Launching Chromium is the most expensive step of `Open the browser with config`. With the
+    pool, the first test of each robot process launches the browser and the next tests of the
+    same process only create a new context on it, so every test is still isolated from the others.
+
+    The browser is not shared between processes, so the pool only helps when a process runs
+    several browser tests: ``robot`` or pabot with suite-level split. With ``--testlevelsplit``
+    (used by the pipelines) pabot starts a new process for every test, nothing is reused and
+    the pool only adds the bookkeeping, so keep it disabled there.
+
+    The storage state (cookies and localStorage) of a context can be saved after the login and
+    used by the next contexts, so the login is not repeated on every test.
+
+    The library uses the Browser library keywords, so it must be imported after Browser.
+
+    = Usage =
+
+    Enable the pool with the BROWSER_POOL variable (config_variables.py or ``-v BROWSER_POOL:True``),
+    `Open the browser with config` and `Close the browser with config` use it automatically.
+
+    | Acquire Pooled Browser      | chromium | headless=True |
+    | New Context                 |          |               |
+    | Save Pooled Storage State   |          |               |
+    | Release Pooled Browser      |          |               |
+    | Log Browser Pool Statistics |          |               |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self):
+        """Initialize the BrowserPool library."""
+        self.ROBOT_LIBRARY_LISTENER = self
+        self.browsers = {}
+        self.storage_state = None
+        self.launches = 0
+        self.launch_time = 0.0
+        self.reuses = 0
+        self.reuse_time = 0.0
+
+    @keyword('Acquire Pooled Browser')
+    def acquire_pooled_browser(self, browser='chromium', headless=False):
+        """Return the browser of this process, launching it only if it is not open yet.
+
+        Args:
+            browser (str): Browser to use (chromium, firefox or webkit, default: chromium)
+            headless (bool): Run the browser in headless mode (default: False)
+
+        Returns:
+            str: Id of the browser
+        """
+        builtin = BuiltIn()
+        key = (str(browser).lower(), str(headless).lower())
+        browser_id = self.browsers.get(key)
+
+        start = perf_counter()
+        if browser_id is not None and browser_id in builtin.run_keyword('Browser.Get Browser Ids'):
+            builtin.run_keyword('Browser.Switch Browser', browser_id)
+            self.reuses += 1
+            self.reuse_time += perf_counter() - start
+            logger.info(f"Reusing pooled browser {browser_id}")
+        else:
+            browser_id = builtin.run_keyword('Browser.New Browser', f'browser={browser}', f'headless={headless}')
+            self.browsers[key] = browser_id
+            self.launches += 1
+            self.launch_time += perf_counter() - start
+            logger.info(f"Launched pooled browser {browser_id}")
+        return browser_id
+
+    @keyword('Release Pooled Browser')
+    def release_pooled_browser(self):
+        """Close the current context and its pages, keeping the browser open for the next test."""
+        BuiltIn().run_keyword('Browser.Close Context', 'CURRENT')
+
+    @keyword('Save Pooled Storage State')
+    def save_pooled_storage_state(self):
+        """Save the cookies and localStorage of the current context for the next contexts.
+
+        Typically used after the login, the next contexts created by `Config New Context`
+        start already authenticated.
+
+        Returns:
+            str: Path of the storage state file
+        """
+        self.storage_state = BuiltIn().run_keyword('Browser.Save Storage State')
+        logger.info(f"Storage state saved: {self.storage_state}")
+        return self.storage_state
+
+    @keyword('Get Pooled Storage State')
+    def get_pooled_storage_state(self):
+        """Return the storage state saved with `Save Pooled Storage State`.
+
+        Returns:
+            str: Path of the storage state file, or None if no state was saved
+        """
+        if self.storage_state and not os.path.exists(self.storage_state):
+            self.storage_state = None
+        return self.storage_state
+
+    @keyword('Clear Pooled Storage State')
+    def clear_pooled_storage_state(self):
+        """Stop using the saved storage state in the next contexts."""
+        self.storage_state = None
+
+    @keyword('Log Browser Pool Statistics')
+    def log_browser_pool_statistics(self):
+        """Log the browser launches, reuses and the estimated time saved by the pool.
+
+        Returns:
+            dict: Statistics of the pool in this process
+        """
+        statistics = self.statistics()
+        logger.info(self.format_statistics(statistics))
+        return statistics
+
+    @not_keyword
+    def statistics(self):
+        """Return the statistics of the pool in this process.
+
+        The time saved is estimated as the number of reuses multiplied by the average launch time,
+        minus the time spent switching to the pooled browser.
+
+        Returns:
+            dict: Launches, reuses, launch and reuse times and estimated time saved (seconds)
+        """
+        average_launch = self.launch_time / self.launches if self.launches else 0.0
+        return {
+            'launches': self.launches,
+            'launch_time': round(self.launch_time, 3),
+            'average_launch_time': round(average_launch, 3),
+            'reuses': self.reuses,
+            'reuse_time': round(self.reuse_time, 3),
+            'estimated_time_saved': round(max(self.reuses * average_launch - self.reuse_time, 0.0), 3),
+        }
+
+    @staticmethod
+    @not_keyword
+    def format_statistics(statistics):
+        return (f"Browser pool: {statistics['launches']} launches "
+                f"({statistics['average_launch_time']:.3f}s average), "
+                f"{statistics['reuses']} reuses ({statistics['reuse_time']:.3f}s), "
+                f"estimated time saved: {statistics['estimated_time_saved']:.3f}s")
+
+    def _close(self):
+        # Library listener method, called when the execution ends. The underscore
+        # prefix keeps it from being exposed as a keyword.
+        if self.launches:
+            logger.console(f"\n{self.format_statistics(self.statistics())} (pid {os.getpid()})")
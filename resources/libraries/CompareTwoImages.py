@@ -4,6 +4,7 @@ import requests
 from io import BytesIO
 from skimage.metrics import structural_similarity as ssim
 from robot.api.deco import not_keyword, keyword
+from BaselineStore import BaselineStore, structural_similarity
 
 
 class CompareTwoImages:
@@ -29,11 +30,43 @@ class CompareTwoImages:
     Compare Images
     ...    ${EXECDIR}/resources/files/images/logo_imagem.png
     ...    www.image.com.br/imagem.png
+
+    = Baseline Store =
+
+    Baselines (the first image) can be read from a store built with BaselineStore.py, which keeps
+    them already decoded, with their SSIM statistics, in a file shared by all the pabot workers.
+    Baselines not found in the store, or changed after it was built, are read from the file.
+
+    Library    CompareTwoImages.py    baseline_store=${EXECDIR}/reports/baselines/baselines.json
     """
 
-    def __init__(self):
-        """Initialize the CompareTwoImages library."""
-        pass
+    def __init__(self, baseline_store=None):
+        """Initialize the CompareTwoImages library.
+
+        Args:
+            baseline_store (str): Index of the baseline store used by default (default: no store)
+        """
+        self.baseline_store = baseline_store
+        self.stores = {}
+
+    @not_keyword
+    def load_baseline(self, image_source, baseline_store=None):
+        """Return the pre-decoded arrays of a baseline from the store.
+
+        Args:
+            image_source (str): Path to the baseline image
+            baseline_store (str): Index of the store (default: library baseline_store)
+
+        Returns:
+            dict: gray, rgb, means and variances arrays, or None if the image is not in the store
+        """
+        index_path = baseline_store or self.baseline_store
+        if not index_path:
+            return None
+        store = self.stores.get(index_path)
+        if store is None:
+            store = self.stores[index_path] = BaselineStore(index_path)
+        return store.get(image_source)
 
     @not_keyword
     def load_image(self, image_source):
@@ -53,7 +86,7 @@ class CompareTwoImages:
         return img
 
     @keyword('Compare Images')
-    def compare_images(self, image_source1, image_source2, similarity_threshold=0.9):
+    def compare_images(self, image_source1, image_source2, similarity_threshold=0.9, baseline_store=None):
         """Compare two images and determine if they are similar.
 
         This method uses the Structural Similarity Index (SSIM) to compare images.
@@ -63,6 +96,7 @@ class CompareTwoImages:
             image_source1 (str): Path to the first image (local file path or URL)
             image_source2 (str): Path to the second image (local file path or URL)
             similarity_threshold (float): Minimum similarity threshold (0.0 to 1.0, default: 0.9)
+            baseline_store (str): Index of the baseline store of the first image (default: library baseline_store)
 
         Raises:
             Exception: If the images are not similar enough based on the threshold
@@ -71,20 +105,30 @@ class CompareTwoImages:
             print(f"Source img 1: {image_source1}")
             print(f"Source img 2: {image_source2}")
 
-            # Load images (from web or local)
-            img1 = self.load_image(image_source1).convert('L')
-            img2 = self.load_image(image_source2).convert('L')
+            baseline = self.load_baseline(image_source1, baseline_store)
+            if baseline is not None:
+                # Baseline already decoded, only the statistics of the second image are computed
+                size = baseline['gray'].shape[::-1]
+                img2 = self.load_image(image_source2).convert('L')
+                if img2.size != size:
+                    img2 = img2.resize(size)
+                sim_index = structural_similarity(baseline['gray'], np.array(img2),
+                                                  baseline['means'], baseline['variances'])
+            else:
+                # Load images (from web or local)
+                img1 = self.load_image(image_source1).convert('L')
+                img2 = self.load_image(image_source2).convert('L')
 
-            # Resize images to the same size (if necessary)
-            if img1.size != img2.size:
-                img2 = img2.resize(img1.size)
+                # Resize images to the same size (if necessary)
+                if img1.size != img2.size:
+                    img2 = img2.resize(img1.size)
 
-            # Convert images to NumPy arrays
-            arr1 = np.array(img1)
-            arr2 = np.array(img2)
+                # Convert images to NumPy arrays
+                arr1 = np.array(img1)
+                arr2 = np.array(img2)
 
-            # Calculate similarity using SSIM
-            sim_index, _ = ssim(arr1, arr2, full=True)
+                # Calculate similarity using SSIM
+                sim_index, _ = ssim(arr1, arr2, full=True)
             sim_index_perc = sim_index * 100
 
             # Check if similarity is above the threshold
@@ -99,7 +143,7 @@ class CompareTwoImages:
             raise
 
     @keyword('Calculate Image Similarity')
-    def calculate_image_similarity(self, image1_path, image2_path, similarity_threshold=90):
+    def calculate_image_similarity(self, image1_path, image2_path, similarity_threshold=90, baseline_store=None):
         """Compare two images and validate their similarity using pixel difference method.
 
         This method uses pixel-by-pixel comparison to determine image similarity.
@@ -108,6 +152,7 @@ class CompareTwoImages:
             image1_path (str): Path to the first image (local file path)
             image2_path (str): Path to the second image (local file path)
             similarity_threshold (float): Minimum percentage of desired similarity (0 to 100, default: 90)
+            baseline_store (str): Index of the baseline store of the first image (default: library baseline_store)
 
         Returns:
             float: Calculated similarity percentage
@@ -115,13 +160,20 @@ class CompareTwoImages:
         Raises:
             Exception: If the similarity is less than the specified threshold
         """
-        img1 = Image.open(image1_path).convert("RGB")
+        baseline = self.load_baseline(image1_path, baseline_store)
         img2 = Image.open(image2_path).convert("RGB")
-        diff = ImageChops.difference(img1, img2)
+        if baseline is not None and baseline['rgb'].shape[1::-1] == img2.size:
+            # Baseline already decoded, same sum of the absolute RGB differences
+            difference = np.abs(baseline['rgb'].astype(np.int16) - np.asarray(img2, dtype=np.int16))
+            diff_data = int(difference.sum(dtype=np.int64))
+            total_pixels = baseline['rgb'].size  # Total RGB values
+        else:
+            img1 = Image.open(image1_path).convert("RGB")
+            diff = ImageChops.difference(img1, img2)
 
-        diff_data = sum(sum(pixel)
-                        for pixel in diff.getdata())  # Sum of RGB components
-        total_pixels = img1.size[0] * img1.size[1] * 3  # Total RGB values
+            diff_data = sum(sum(pixel)
+                            for pixel in diff.getdata())  # Sum of RGB components
+            total_pixels = img1.size[0] * img1.size[1] * 3  # Total RGB values
         similarity = 1 - (diff_data / 255 / total_pixels)
         similarity_percentage = similarity * 100
 
@@ -1,23 +1,44 @@
+import hashlib
+import io
+import json
 import os
+import re
+from pathlib import Path
 from dotenv import dotenv_values, load_dotenv
 from robot.api.deco import keyword
 from robot.api import Failure
 
+# Directory of the resolved environment snapshots (contains secrets, must not be committed)
+SNAPSHOT_DIRECTORY = '.env_snapshot'
+
+# Variables referenced by the interpolation, e.g. ${DB_HOST} or ${DB_PORT:-3306}
+REFERENCE_PATTERN = re.compile(r'\$\{([^}:]+)')
+
+# Variables defined in a file, e.g. DB_HOST=localhost or export DB_HOST=localhost
+DEFINITION_PATTERN = re.compile(r'^\s*(?:export\s+)?([^\s=#]+)\s*=', re.MULTILINE)
+
+# Files of the last snapshot loaded in this process, by variable
+_PROVENANCE = {}
+
 
 @keyword('Set Environment Project Variables')
-def set_environment_project_variables(pipeline: bool = False, environment: str = 'rc', print_variables: bool = False):
+def set_environment_project_variables(pipeline: bool = False, environment: str = 'rc', print_variables: bool = False,
+                                      snapshot: bool = False):
     """
     Set Environment Project Variables
 
-    This keyword configures environment variables for the current session. It supports two modes:
+    This keyword configures environment variables for the current session. It supports three modes:
 
     1. Pipeline Mode (`pipeline=True`): Loads variables directly from the OS environment.
     2. File Environment Mode (`pipeline=False`): Loads variables from a `.env` file corresponding to the specified environment name.
+    3. Snapshot Mode (`snapshot=True`): Resolves the layered files `.env` -> `[environment].env` -> `[environment].local.env`
+       once and caches the result in `.env_snapshot/`, so the other pabot processes only read the cached file.
 
     Arguments:
         pipeline (bool): Flag to determine if variables should be loaded from the OS environment (default: False).
         environment (str): The name of the `.env` file to load (default: 'rc').
         print_variables (bool): Flag to print loaded environment variables to the console (default: False).
+        snapshot (bool): Flag to load the layered files using the cached snapshot (default: False).
 
     Returns:
         dict: Key-value pairs of the loaded environment variables.
@@ -27,20 +48,142 @@ def set_environment_project_variables(pipeline: bool = False, environment: str =
 
     Additional Behavior:
         If `print_variables` is True, prints all loaded environment variables in the format "key: value" to the console.
+        In snapshot mode, the file that defined each variable is printed too.
     """
 
     if (pipeline):
-        value = os.environ
+        value = dict(os.environ)
+    elif (snapshot):
+        value = load_environment_snapshot(environment)
     else:
         load_dotenv(f"{environment.lower()}.env")
         value = dotenv_values(f"{environment.lower()}.env")
 
     if (print_variables):
-        for name, value in value.items():
-            print("{0}: {1}".format(name, value))
+        # The provenance is only known for the variables of the snapshot loaded by this call
+        provenance = _PROVENANCE if (snapshot and not pipeline) else {}
+        for name, variable_value in value.items():
+            if (name in provenance):
+                print("{0}: {1} ({2})".format(name, variable_value, provenance[name]))
+            else:
+                print("{0}: {1}".format(name, variable_value))
 
     if (value):
         return value
     else:
         raise Failure(
             f"Please check environment key value ou file: key value {environment}")
+
+
+@keyword('Load Environment Snapshot')
+def load_environment_snapshot(environment: str = 'rc', directory: str = '.'):
+    """
+    Load Environment Snapshot
+
+    Loads the layered environment files into the OS environment using a cached snapshot. The layers are,
+    from lowest to highest priority:
+
+    1. `.env`: values shared by all environments
+    2. `[environment].env`: values of the environment (e.g. `uat.env`)
+    3. `[environment].local.env`: local overrides, not committed
+
+    Missing layers are ignored. The first call resolves the layers with python-dotenv, including the
+    `${VARIABLE}` interpolation, and writes the result to `.env_snapshot/`. The snapshot is keyed by the
+    content of the layers and of the OS variables they reference, so any change creates a new snapshot;
+    the previous snapshots of the environment are then removed, so resolved secrets do not pile up.
+    As with `load_dotenv`, variables already defined in the OS environment are not overridden.
+
+    Arguments:
+        environment (str): The name of the environment (default: 'rc').
+        directory (str): Directory of the `.env` files (default: current directory).
+
+    Returns:
+        dict: Key-value pairs of the resolved environment variables.
+
+    Raises:
+        Failure: If none of the layers exists.
+    """
+    layers = [Path(directory) / name for name in _layer_names(environment) if (Path(directory) / name).is_file()]
+    if (not layers):
+        raise Failure(
+            f"Please check environment files: none of {', '.join(_layer_names(environment))} found in {directory}")
+
+    contents = [layer.read_text(encoding='utf-8') for layer in layers]
+    snapshot_file = Path(SNAPSHOT_DIRECTORY) / f"{environment.lower()}_{_snapshot_key(layers, contents)}.json"
+
+    if (snapshot_file.is_file()):
+        with open(snapshot_file, encoding='utf-8') as cached_file:
+            snapshot_data = json.load(cached_file)
+    else:
+        snapshot_data = _resolve_layers(layers, contents)
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file = snapshot_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temporary_file, 'w', encoding='utf-8') as cached_file:
+            json.dump(snapshot_data, cached_file, indent=2)
+        os.replace(temporary_file, snapshot_file)
+        _remove_old_snapshots(snapshot_file, environment)
+
+    for name, value in snapshot_data['values'].items():
+        if (value is not None):
+            os.environ.setdefault(name, value)
+
+    _PROVENANCE.clear()
+    _PROVENANCE.update(snapshot_data['provenance'])
+    return dict(snapshot_data['values'])
+
+
+@keyword('Get Environment Variables Provenance')
+def get_environment_variables_provenance():
+    """
+    Get Environment Variables Provenance
+
+    Returns the file that defined each variable loaded by the last `Load Environment Snapshot`,
+    useful to find which layer overrides a value.
+
+    Returns:
+        dict: File name by variable name.
+    """
+    return dict(_PROVENANCE)
+
+
+def _layer_names(environment):
+    return ['.env', f"{environment.lower()}.env", f"{environment.lower()}.local.env"]
+
+
+def _snapshot_key(layers, contents):
+    digest = hashlib.sha256()
+    defined = set()
+    referenced = set()
+    for layer, content in zip(layers, contents):
+        digest.update(f"{layer.name}\0{content}\0".encode('utf-8'))
+        defined.update(DEFINITION_PATTERN.findall(content))
+        referenced.update(REFERENCE_PATTERN.findall(content))
+    # The interpolation can use OS variables not defined in the files, their values are part of the key
+    for name in sorted(referenced - defined):
+        digest.update(f"{name}={os.environ.get(name)}\0".encode('utf-8'))
+    return digest.hexdigest()[:24]
+
+
+def _remove_old_snapshots(snapshot_file, environment):
+    pattern = re.compile(rf"{re.escape(environment.lower())}_[0-9a-f]{{24}}\.json")
+    for old_file in snapshot_file.parent.iterdir():
+        if (old_file != snapshot_file and pattern.fullmatch(old_file.name)):
+            try:
+                old_file.unlink()
+            except OSError:
+                # Removed by another process, or still open on Windows; the next snapshot removes it
+                pass
+
+
+def _resolve_layers(layers, contents):
+    # All layers are parsed as one stream, so the higher layers override the lower ones
+    # and can interpolate their values
+    stream = io.StringIO('\n'.join(content.rstrip('\n') for content in contents) + '\n')
+    values = dotenv_values(stream=stream)
+
+    provenance = {}
+    for layer, content in zip(layers, contents):
+        for name in dotenv_values(stream=io.StringIO(content), interpolate=False):
+            provenance[name] = layer.name
+
+    return {'files': [layer.name for layer in layers], 'values': values, 'provenance': provenance}
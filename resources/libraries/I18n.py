@@ -0,0 +1,168 @@
+import copy
+import json
+from pathlib import Path
+from robot.api import Failure
+from robot.api.deco import keyword, not_keyword
+
+DEFAULT_I18N_DIRECTORY = Path(__file__).resolve().parents[1] / 'files' / 'i18n'
+
+# Registries already loaded in this process, by directory
+_REGISTRIES = {}
+
+
+class I18n:
+    """Library with an in-memory registry of the language dictionaries.
+
+    All language files of resources/files/i18n (pt, ar, co, mx, page_pt...) are loaded once
+    per process and shared by every suite. Nested keys are flattened with dots, so
+    ``home.pageTitle`` is a single dictionary lookup.
+
+    = Fallbacks =
+
+    A language can fall back to other languages when a key does not exist in its file.
+    Fallbacks are configured with the ``LANG_FALLBACKS`` dictionary of config_variables.py
+    and are followed as a chain, e.g. ``mx`` -> ``pt``.
+
+    = Usage =
+
+    | ${title}=       | Translate             | home.pageTitle | page_pt |
+    | ${dictionary}=  | Set Current Language  | pt             |         |
+    | ${title}=       | Translate             | DEMOQA         |         |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self, directory=None, fallbacks=None, default_language='pt'):
+        """Initialize the I18n library.
+
+        Args:
+            directory (str): Directory with the [language].json files (default: resources/files/i18n)
+            fallbacks (dict): Fallback languages by language, values can be a language or a list of languages
+            default_language (str): Language used by Translate when no language was set (default: pt)
+        """
+        self.directory = Path(directory).resolve() if directory else DEFAULT_I18N_DIRECTORY
+        self.fallbacks = {}
+        for language, fallback in (fallbacks or {}).items():
+            self.fallbacks[language] = [fallback] if isinstance(fallback, str) else list(fallback)
+        self.current_language = default_language
+
+    @not_keyword
+    def registry(self):
+        """Return the loaded languages, loading all files of the directory on first use.
+
+        Returns:
+            dict: {language: (nested dictionary, flattened dictionary)}
+        """
+        registry = _REGISTRIES.get(self.directory)
+        if registry is None:
+            registry = {}
+            for file_path in sorted(self.directory.glob('*.json')):
+                with open(file_path, encoding='utf-8') as language_file:
+                    dictionary = json.load(language_file)
+                registry[file_path.stem] = (dictionary, flatten_dictionary(dictionary))
+            _REGISTRIES[self.directory] = registry
+        return registry
+
+    @not_keyword
+    def language_chain(self, language):
+        """Return the language followed by its fallbacks, without repetitions.
+
+        Args:
+            language (str): Language name
+
+        Returns:
+            list: Languages in the order they must be searched
+        """
+        chain = []
+        pending = [language]
+        while pending:
+            current = pending.pop(0)
+            if current in chain:
+                continue
+            chain.append(current)
+            pending.extend(self.fallbacks.get(current, []))
+        return chain
+
+    @keyword('Get Language Dictionary')
+    def get_language_dictionary(self, language):
+        """Return the dictionary of a language file, without loading the file again.
+
+        A copy of the loaded dictionary is returned, so a test that changes it does not
+        change the dictionary of the next tests of the process.
+
+        Args:
+            language (str): Language file name without extension, e.g. pt or page_pt
+
+        Returns:
+            dict: Nested language dictionary
+
+        Raises:
+            Failure: If the language file does not exist
+        """
+        registry = self.registry()
+        if language not in registry:
+            raise Failure(f"Language file '{language}.json' not found in {self.directory}. "
+                          f"Available languages: {', '.join(registry)}")
+        return copy.deepcopy(registry[language][0])
+
+    @keyword('Set Current Language')
+    def set_current_language(self, language):
+        """Set the language used by Translate and return its dictionary.
+
+        Args:
+            language (str): Language file name without extension
+
+        Returns:
+            dict: Nested language dictionary
+        """
+        dictionary = self.get_language_dictionary(language)
+        self.current_language = language
+        return dictionary
+
+    @keyword('Translate')
+    def translate(self, key, language=None, default=None):
+        """Return the text of a key, following the fallback chain of the language.
+
+        Args:
+            key (str): Key of the text, nested keys separated by dots (e.g. home.pageTitle)
+            language (str): Language to use (default: language of Set Current Language)
+            default (str): Value returned when the key does not exist (default: fail)
+
+        Returns:
+            The text of the key
+
+        Raises:
+            Failure: If the key does not exist in the language or in its fallbacks and no default is given
+        """
+        registry = self.registry()
+        chain = self.language_chain(language or self.current_language)
+        for current in chain:
+            flattened = registry.get(current, (None, {}))[1]
+            if key in flattened:
+                value = flattened[key]
+                # Intermediate keys return nested dictionaries of the registry
+                return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        if default is not None:
+            return default
+        raise Failure(f"Translation key '{key}' not found for languages: {' -> '.join(chain)}")
+
+
+def flatten_dictionary(dictionary, prefix=''):
+    """Flatten a nested dictionary using dots to join the keys.
+
+    Intermediate keys are kept too, so both ``home`` and ``home.pageTitle`` can be found.
+
+    Args:
+        dictionary (dict): Nested dictionary
+        prefix (str): Prefix of the keys (used in the recursion)
+
+    Returns:
+        dict: Flattened dictionary
+    """
+    flattened = {}
+    for key, value in dictionary.items():
+        full_key = f'{prefix}{key}'
+        flattened[full_key] = value
+        if isinstance(value, dict):
+            flattened.update(flatten_dictionary(value, f'{full_key}.'))
+    return flattened
@@ -0,0 +1,264 @@
+import re
+from robot.api import Failure, logger
+from robot.api.deco import keyword, not_keyword
+
+# Condition of Filter Dictionary List: <key> <operator> <value>
+CONDITION_PATTERN = re.compile(r'^\s*(?P<key>.+?)\s*(?P<operator>==|!=|>=|<=|=~|>|<)\s*(?P<value>.*?)\s*$')
+
+OPERATORS = {
+    '==': lambda actual, expected: actual == expected,
+    '!=': lambda actual, expected: actual != expected,
+    '>=': lambda actual, expected: actual >= expected,
+    '<=': lambda actual, expected: actual <= expected,
+    '>': lambda actual, expected: actual > expected,
+    '<': lambda actual, expected: actual < expected,
+    '=~': lambda actual, expected: re.search(expected, actual) is not None,
+}
+
+
+def index_key(item, keys):
+    """Return the index key of an item, comparing the values as strings like Robot Framework does."""
+    return tuple(str(item[key]) for key in keys)
+
+
+def build_index(data, keys):
+    """Group a list of dictionaries by the string values of some keys.
+
+    Args:
+        data (list): List of dictionaries
+        keys (list): Keys of the index
+
+    Returns:
+        dict: {tuple of values: list of items}, items keep the order of the list
+    """
+    index = {}
+    for item in data:
+        index.setdefault(index_key(item, keys), []).append(item)
+    return index
+
+
+def compile_condition(condition):
+    """Compile a condition such as ``status == active`` or ``pages >= 300`` into a predicate.
+
+    Values are compared as numbers when both sides are numbers and as strings otherwise.
+    ``=~`` searches a regular expression in the value.
+
+    Args:
+        condition (str): Condition in the format <key> <operator> <value>
+
+    Returns:
+        callable: Function that receives an item and returns True if it matches
+
+    Raises:
+        Failure: If the condition is not valid
+    """
+    match = CONDITION_PATTERN.match(str(condition))
+    if not match:
+        raise Failure(f"Invalid condition '{condition}', use <key> <operator> <value> "
+                      f"with one of the operators: {', '.join(OPERATORS)}")
+    key, operator, expected = match.group('key', 'operator', 'value')
+    compare = OPERATORS[operator]
+    expected_number = to_number(expected) if operator != '=~' else None
+
+    def predicate(item):
+        actual = item.get(key)
+        if expected_number is not None:
+            actual_number = to_number(actual)
+            if actual_number is not None:
+                return compare(actual_number, expected_number)
+        return compare(str(actual), expected)
+
+    return predicate
+
+
+def to_number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value))
+    except ValueError:
+        return None
+
+
+def project(items, fields):
+    """Return copies of the items with only some fields, missing fields are ignored."""
+    if not fields:
+        return list(items)
+    return [{field: item[field] for field in fields if field in item} for item in items]
+
+
+class IndexedData:
+    """Library to query lists of dictionaries (database rows, API results) with hash indexes.
+
+    An index groups the items by the values of one or more keys, so each lookup is a single
+    dictionary access instead of a loop over the whole list. Values are compared as strings,
+    with the same result as the comparisons done in Robot Framework syntax.
+
+    Indexes keep references to the items of the list; if the list changes, build the index again.
+
+    = Usage =
+
+    | Build Index      | ${books_list}      | author             | name=books    |           |
+    | ${by_author}=    | Lookup By Index    | books              | Axel Rauschmayer |        |
+    | ${groups}=       | Get Index Groups   | books              |               |           |
+    | ${long_books}=   | Filter Dictionary List | ${books_list}  | pages >= 400  | fields=title |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        """Initialize the IndexedData library."""
+        self.indexes = {}
+
+    @keyword('Build Index')
+    def build_index(self, data, *keys, name=None):
+        """Build a hash index of a list of dictionaries on one or more keys.
+
+        Args:
+            data (list): List of dictionaries
+            keys (list): Keys of the index
+            name (str): Name of the index (default: the keys joined by commas)
+
+        Returns:
+            str: Name of the index
+
+        Raises:
+            Failure: If no key is given or an item does not have one of the keys
+        """
+        if not keys:
+            raise Failure("At least one key is required to build an index")
+        name = name or ','.join(keys)
+        try:
+            self.indexes[name] = (keys, build_index(data, keys))
+        except KeyError as error:
+            raise Failure(f"Item without the key {error} in the data of the index '{name}'")
+        logger.info(f"Index '{name}' built with {len(data)} items and {len(self.indexes[name][1])} distinct keys")
+        return name
+
+    @not_keyword
+    def get_index(self, name):
+        if name not in self.indexes:
+            raise Failure(f"Index '{name}' not found. Available indexes: {', '.join(self.indexes) or 'none'}")
+        return self.indexes[name]
+
+    @keyword('Lookup By Index')
+    def lookup_by_index(self, name, *values, fields=None):
+        """Return the items whose indexed keys have the given values.
+
+        Args:
+            name (str): Name of the index
+            values (list): One value for each key of the index, in the same order
+            fields (list): Return only these fields of the items (default: whole items)
+
+        Returns:
+            list: Matching items, in the order of the original list
+        """
+        keys, index = self.get_index(name)
+        if len(values) != len(keys):
+            raise Failure(f"Index '{name}' has {len(keys)} keys ({', '.join(keys)}), got {len(values)} values")
+        return project(index.get(tuple(str(value) for value in values), []), self.fields(fields))
+
+    @keyword('Get Index Groups')
+    def get_index_groups(self, name, fields=None):
+        """Return the items grouped by the values of the indexed keys.
+
+        Args:
+            name (str): Name of the index
+            fields (list): Return only these fields of the items (default: whole items)
+
+        Returns:
+            dict: Lists of items by value; for multi-key indexes the values are joined by commas
+        """
+        _, index = self.get_index(name)
+        return {','.join(key): project(items, self.fields(fields)) for key, items in index.items()}
+
+    @keyword('Count By Index')
+    def count_by_index(self, name):
+        """Return the number of items for each value of the indexed keys.
+
+        Args:
+            name (str): Name of the index
+
+        Returns:
+            dict: Number of items by value; for multi-key indexes the values are joined by commas
+        """
+        _, index = self.get_index(name)
+        return {','.join(key): len(items) for key, items in index.items()}
+
+    @keyword('Drop Index')
+    def drop_index(self, name):
+        """Remove an index built with `Build Index`."""
+        self.indexes.pop(name, None)
+
+    @keyword('Filter Dictionary List')
+    def filter_dictionary_list(self, data, *conditions, fields=None, index=None, index_values=None):
+        """Return the items that match all conditions.
+
+        Conditions have the format ``<key> <operator> <value>`` with the operators
+        ``==``, ``!=``, ``>``, ``>=``, ``<``, ``<=`` and ``=~`` (regular expression), e.g.
+        ``status == active``, ``pages >= 300`` or ``title =~ ^Java``.
+
+        The search can start from an index lookup, so the conditions are only checked on
+        the items of that key.
+
+        Args:
+            data (list): List of dictionaries (ignored when index is given)
+            conditions (list): Conditions that must all be true
+            fields (list): Return only these fields of the items (default: whole items)
+            index (str): Name of an index used to select the candidates (default: whole list)
+            index_values (list): Values of the index keys, required with index
+
+        Returns:
+            list: Matching items, in the order of the original list
+        """
+        predicates = [compile_condition(condition) for condition in conditions]
+        if index is not None:
+            values = index_values if isinstance(index_values, (list, tuple)) else [index_values]
+            candidates = self.lookup_by_index(index, *values)
+        else:
+            candidates = data
+        return project([item for item in candidates if all(predicate(item) for predicate in predicates)],
+                       self.fields(fields))
+
+    @keyword('Project Dictionary List')
+    def project_dictionary_list(self, data, *fields):
+        """Return copies of the items with only some fields.
+
+        Args:
+            data (list): List of dictionaries
+            fields (list): Fields to keep, missing fields are ignored
+
+        Returns:
+            list: Dictionaries with only the given fields
+        """
+        return project(data, fields)
+
+    @keyword('Filter Dictionary List By Key And Value')
+    def filter_dictionary_list_by_key_and_value(self, data, key, value):
+        """Return the items whose key has the value, comparing both as strings.
+
+        Args:
+            data (list): List of dictionaries
+            key (str): Key to filter by
+            value (str): Value of the key
+
+        Returns:
+            list: Matching items, in the order of the original list
+
+        Raises:
+            Failure: If an item does not have the key
+        """
+        value = str(value)
+        try:
+            return [item for item in data if str(item[key]) == value]
+        except KeyError:
+            raise Failure(f"Dictionary does not contain key '{key}'.")
+
+    @staticmethod
+    @not_keyword
+    def fields(fields):
+        if fields is None or isinstance(fields, (list, tuple)):
+            return fields
+        return [field.strip() for field in str(fields).split(',')]
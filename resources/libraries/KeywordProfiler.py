@@ -0,0 +1,223 @@
+"""
+Keyword Profiler Listener
+
+Robot Framework listener that measures how much time each keyword takes during
+a run. Timings are taken with a monotonic clock and aggregated in memory; the
+results are written only once, when the execution ends:
+
+- ``keyword_profile_<pid>.folded``: flamegraph-compatible folded stacks
+  (``suite;test;keyword;keyword <self time in microseconds>``)
+- ``keyword_profile_<pid>.json``: per-keyword summary (calls, total, self, max)
+
+Each pabot worker writes its own files (the process id is part of the name), so
+the outputs of all workers can be merged after the run.
+
+Usage:
+    robot --listener resources/libraries/KeywordProfiler.py:reports/profiling ./tests
+    pabot --processes 4 --listener resources/libraries/KeywordProfiler.py:reports/profiling ./tests
+
+    # Merge the per-worker files into keyword_profile.folded and keyword_profile_summary.md
+    python resources/libraries/KeywordProfiler.py reports/profiling
+
+The folded file can be rendered with any flamegraph tool, e.g.
+``flamegraph.pl reports/profiling/keyword_profile.folded > profile.svg`` or speedscope.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from time import perf_counter_ns
+
+# Listener body items that represent real keyword calls. Control structures
+# (FOR, IF, TRY...) are not frames, their time is attributed to the keyword
+# that contains them.
+KEYWORD_TYPES = ('KEYWORD', 'SETUP', 'TEARDOWN')
+
+FOLDED_PATTERN = 'keyword_profile_[0-9]*.folded'
+SUMMARY_PATTERN = 'keyword_profile_[0-9]*.json'
+
+
+class KeywordProfiler:
+    """Listener that records start and end times of every executed keyword."""
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self, output_dir='reports/profiling'):
+        """
+        Initialize the profiler.
+
+        Args:
+            output_dir (str): Directory where the profile files are written (default: reports/profiling)
+        """
+        self.output_dir = Path(output_dir)
+        self._frames = []
+        self._stack = []
+        self._folded = {}
+        self._summary = {}
+
+    def start_suite(self, name, attrs):
+        self._frames.append(self._frame_name(attrs['longname']))
+
+    def end_suite(self, name, attrs):
+        self._frames.pop()
+
+    def start_test(self, name, attrs):
+        self._frames.append(self._frame_name(name))
+
+    def end_test(self, name, attrs):
+        self._frames.pop()
+
+    def start_keyword(self, name, attrs):
+        if attrs['type'] not in KEYWORD_TYPES:
+            return
+        # [name, start time, time spent in child keywords]
+        self._stack.append([self._frame_name(name), perf_counter_ns(), 0])
+
+    def end_keyword(self, name, attrs):
+        if attrs['type'] not in KEYWORD_TYPES or not self._stack:
+            return
+        keyword_name, start, children = self._stack.pop()
+        elapsed = perf_counter_ns() - start
+        own = elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+        stack = ';'.join(self._frames + [frame[0] for frame in self._stack] + [keyword_name])
+        self._folded[stack] = self._folded.get(stack, 0) + own
+
+        stats = self._summary.get(keyword_name)
+        if stats is None:
+            stats = self._summary[keyword_name] = [0, 0, 0, 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += own
+        if elapsed > stats[3]:
+            stats[3] = elapsed
+
+    def close(self):
+        """Write the folded stacks and the keyword summary of this process."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        pid = os.getpid()
+
+        folded = {stack: ns // 1000 for stack, ns in self._folded.items()}
+        write_folded(self.output_dir / f'keyword_profile_{pid}.folded', folded)
+
+        summary = {
+            name: {'calls': calls, 'total_ns': total, 'self_ns': own, 'max_ns': longest}
+            for name, (calls, total, own, longest) in self._summary.items()
+        }
+        with open(self.output_dir / f'keyword_profile_{pid}.json', 'w', encoding='utf-8') as f:
+            json.dump(summary, f)
+
+    @staticmethod
+    def _frame_name(name):
+        # ';' separates frames and ' ' the sample count in the folded format
+        return name.replace(';', ':').replace('\n', ' ')
+
+
+def write_folded(path, folded):
+    """
+    Write folded stacks to a file, one ``stack count`` pair per line.
+
+    Args:
+        path (Path): Output file
+        folded (dict): Mapping of folded stack to time in microseconds
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, micros in sorted(folded.items()):
+            if micros > 0:
+                f.write(f'{stack} {micros}\n')
+
+
+def merge_profiles(profile_dir):
+    """
+    Merge the per-worker profile files of a directory.
+
+    Creates ``keyword_profile.folded``, ``keyword_profile_summary.json`` and
+    ``keyword_profile_summary.md`` in the same directory.
+
+    Args:
+        profile_dir (str): Directory containing the keyword_profile_<pid> files
+
+    Returns:
+        dict: Merged per-keyword summary
+    """
+    profile_dir = Path(profile_dir)
+
+    folded = {}
+    for path in sorted(profile_dir.glob(FOLDED_PATTERN)):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                stack, _, micros = line.rstrip('\n').rpartition(' ')
+                if stack:
+                    folded[stack] = folded.get(stack, 0) + int(micros)
+    write_folded(profile_dir / 'keyword_profile.folded', folded)
+
+    summary = {}
+    for path in sorted(profile_dir.glob(SUMMARY_PATTERN)):
+        with open(path, encoding='utf-8') as f:
+            worker_summary = json.load(f)
+        for name, stats in worker_summary.items():
+            merged = summary.setdefault(name, {'calls': 0, 'total_ns': 0, 'self_ns': 0, 'max_ns': 0})
+            merged['calls'] += stats['calls']
+            merged['total_ns'] += stats['total_ns']
+            merged['self_ns'] += stats['self_ns']
+            merged['max_ns'] = max(merged['max_ns'], stats['max_ns'])
+
+    with open(profile_dir / 'keyword_profile_summary.json', 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    with open(profile_dir / 'keyword_profile_summary.md', 'w', encoding='utf-8') as f:
+        f.write(generate_markdown_summary(summary))
+
+    return summary
+
+
+def generate_markdown_summary(summary, limit=50):
+    """
+    Generate a Markdown table with the keywords that took more time.
+
+    Args:
+        summary (dict): Per-keyword summary as returned by merge_profiles
+        limit (int): Maximum number of keywords in the table (default: 50)
+
+    Returns:
+        str: Report in Markdown format, sorted by self time
+    """
+    report = """## Keyword Profile
+
+| Keyword | Calls | Total (ms) | Self (ms) | Average (ms) | Max (ms) |
+|---------|-------|------------|-----------|--------------|----------|
+"""
+    ranking = sorted(summary.items(), key=lambda item: item[1]['self_ns'], reverse=True)
+    for name, stats in ranking[:limit]:
+        average = stats['total_ns'] / stats['calls'] if stats['calls'] else 0
+        report += (f"| {name} | {stats['calls']} | {stats['total_ns'] / 1e6:.2f} | "
+                   f"{stats['self_ns'] / 1e6:.2f} | {average / 1e6:.3f} | {stats['max_ns'] / 1e6:.2f} |\n")
+    return report
+
+
+def main():
+    """
+    Main function for command-line execution.
+
+    Command-line arguments:
+        profile_dir: Directory containing the per-worker profile files (default: reports/profiling)
+
+    Example usage:
+        python KeywordProfiler.py reports/profiling
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Merge keyword profiles written by the KeywordProfiler listener')
+    parser.add_argument('profile_dir', nargs='?', default='reports/profiling',
+                        help='Directory with keyword_profile_<pid> files (default: reports/profiling)')
+    args = parser.parse_args()
+
+    summary = merge_profiles(args.profile_dir)
+    print(f"Merged profile of {len(summary)} keywords saved to: {args.profile_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
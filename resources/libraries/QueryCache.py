@@ -0,0 +1,230 @@
+import copy
+import os
+import re
+import threading
+from collections import OrderedDict
+from time import monotonic
+from robot.api import logger
+from robot.api.deco import keyword, not_keyword
+from robot.libraries.BuiltIn import BuiltIn
+
+# String literals, comments and whitespace of a SQL statement
+SQL_TOKEN_PATTERN = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|(--[^\n]*|/\*.*?\*/)|(\s+)""", re.DOTALL)
+
+READ_STATEMENTS = ('select', 'show', 'with', 'describe', 'desc', 'explain')
+WRITE_PATTERN = re.compile(r'\b(insert|update|delete|merge|replace|truncate|create|alter|drop|rename|grant|revoke)\b',
+                           re.IGNORECASE)
+SCHEMA_CHANGE_PATTERN = re.compile(r'\b(create|alter|drop|rename|truncate)\b', re.IGNORECASE)
+TABLE_PATTERN = re.compile(r'\b(?:from|join|into|update|table)\s+([`"\[]?[\w.$]+[`"\]]?)', re.IGNORECASE)
+
+
+def normalize_sql(statement):
+    """Remove comments, repeated whitespace and the final semicolon, keeping the string literals.
+
+    Args:
+        statement (str): SQL statement
+
+    Returns:
+        str: Normalized statement, used as cache key
+    """
+    def replace(match):
+        literal, comment, _ = match.groups()
+        if literal:
+            return literal
+        return '' if comment else ' '
+
+    return SQL_TOKEN_PATTERN.sub(replace, str(statement)).strip().rstrip(';').strip()
+
+
+def without_literals(statement):
+    return SQL_TOKEN_PATTERN.sub(lambda match: "''" if match.group(1) else ' ', statement)
+
+
+def is_read_only(statement):
+    """Return True if a normalized statement only reads data (SELECT, SHOW, WITH, DESCRIBE, EXPLAIN)."""
+    code = without_literals(statement).strip()
+    first_word = code.split(None, 1)[0].lower() if code else ''
+    return first_word in READ_STATEMENTS and not WRITE_PATTERN.search(code)
+
+
+def statement_tables(statement):
+    """Return the names of the tables used by a statement, lower case and without schema or quotes."""
+    return {name.strip('`"[]').split('.')[-1].lower() for name in TABLE_PATTERN.findall(without_literals(statement))}
+
+
+class QueryCache:
+    """Library to cache the results of read-only database queries.
+
+    Results are cached by the normalized SQL (without comments and repeated whitespace) and
+    its parameters, for a time to live and with a maximum number of entries (least recently used
+    entries are removed first). Queries are executed by DatabaseLibrary, which must be imported too.
+
+    Statements that write data are never cached and remove from the cache the results of the
+    queries that used the same tables; statements that change the schema clear the whole cache.
+    Writes done directly with DatabaseLibrary keywords must be followed by `Invalidate Query Cache`.
+
+    The cache exists in each process, so with pabot every worker has its own cache.
+
+    = Usage =
+
+    Enable the cache with the QUERY_CACHE variable (config_variables.py or ``-v QUERY_CACHE:True``),
+    `Perform a database query` uses it automatically.
+
+    | ${users}=                   | Cached Query        | SELECT * FROM users |
+    | Execute SQL And Invalidate Cache | UPDATE users SET active = 0 |          |
+    | Invalidate Query Cache      | users               |                     |
+    | Log Query Cache Statistics  |                     |                     |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, ttl=300, max_entries=256):
+        """Initialize the QueryCache library.
+
+        Args:
+            ttl (float): Seconds a result stays in the cache (default: 300)
+            max_entries (int): Maximum number of cached results (default: 256)
+        """
+        self.ROBOT_LIBRARY_LISTENER = self
+        self.ttl = float(ttl)
+        self.max_entries = int(max_entries)
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @not_keyword
+    def database(self):
+        return BuiltIn().get_library_instance('DatabaseLibrary')
+
+    @keyword('Cached Query')
+    def cached_query(self, query, return_dict: bool = False, parameters=None, alias=None, ttl=None):
+        """Execute a query with DatabaseLibrary, returning the cached result when it exists.
+
+        Statements that are not read-only are executed without cache and invalidate
+        the cached results of the tables they use.
+
+        Args:
+            query (str): SQL statement
+            return_dict (bool): Return the rows as dictionaries (default: False)
+            parameters (list): Parameters of the statement (default: none)
+            alias (str): Alias of the database connection (default: current connection)
+            ttl (float): Seconds this result stays in the cache (default: library TTL)
+
+        Returns:
+            list: Rows of the result, a copy of the cached result
+        """
+        statement = normalize_sql(query)
+        if not is_read_only(statement):
+            result = self.database().query(query, return_dict=return_dict, alias=alias, parameters=parameters)
+            self.invalidate_statement(statement)
+            return result
+
+        key = (statement, repr(parameters), bool(return_dict), alias)
+        now = monotonic()
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self.entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                logger.info(f"Query cache hit ({self.hits} hits, {self.misses} misses): {statement}")
+                return copy.deepcopy(entry[2])
+
+        result = self.database().query(query, return_dict=return_dict, alias=alias, parameters=parameters)
+        expires = monotonic() + (self.ttl if ttl is None else float(ttl))
+        with self._lock:
+            self.misses += 1
+            self.entries[key] = (expires, statement_tables(statement), copy.deepcopy(result))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            logger.info(f"Query cache miss ({self.hits} hits, {self.misses} misses): {statement}")
+        return result
+
+    @keyword('Execute SQL And Invalidate Cache')
+    def execute_sql_and_invalidate_cache(self, sql_string, parameters=None, alias=None):
+        """Execute a statement with DatabaseLibrary and invalidate the cached results of its tables.
+
+        Args:
+            sql_string (str): SQL statement (INSERT, UPDATE, DELETE...)
+            parameters (list): Parameters of the statement (default: none)
+            alias (str): Alias of the database connection (default: current connection)
+
+        Returns:
+            The result of DatabaseLibrary Execute Sql String
+        """
+        result = self.database().execute_sql_string(sql_string, alias=alias, parameters=parameters)
+        self.invalidate_statement(normalize_sql(sql_string))
+        return result
+
+    @keyword('Invalidate Query Cache')
+    def invalidate_query_cache(self, *tables):
+        """Remove the cached results of queries that used some tables, or all results.
+
+        Args:
+            tables (list): Table names (default: all cached results)
+
+        Returns:
+            int: Number of removed results
+        """
+        names = {str(table).strip('`"[]').split('.')[-1].lower() for table in tables}
+        with self._lock:
+            keys = [key for key, entry in self.entries.items() if not names or entry[1] & names]
+            for key in keys:
+                del self.entries[key]
+            self.invalidations += len(keys)
+        if keys:
+            logger.info(f"Query cache: {len(keys)} results invalidated ({', '.join(sorted(names)) or 'all tables'})")
+        return len(keys)
+
+    @not_keyword
+    def invalidate_statement(self, statement):
+        if SCHEMA_CHANGE_PATTERN.search(without_literals(statement)):
+            self.invalidate_query_cache()
+        else:
+            tables = statement_tables(statement)
+            if tables:
+                self.invalidate_query_cache(*tables)
+
+    @keyword('Log Query Cache Statistics')
+    def log_query_cache_statistics(self):
+        """Log the hits, misses, expirations and invalidations of the cache.
+
+        Returns:
+            dict: Statistics of the cache in this process
+        """
+        statistics = self.statistics()
+        logger.info(self.format_statistics(statistics))
+        return statistics
+
+    @not_keyword
+    def statistics(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'entries': len(self.entries),
+        }
+
+    @staticmethod
+    @not_keyword
+    def format_statistics(statistics):
+        return (f"Query cache: {statistics['hits']} hits, {statistics['misses']} misses "
+                f"({statistics['hit_rate']:.1%} hit rate), {statistics['expirations']} expired, "
+                f"{statistics['invalidations']} invalidated, {statistics['entries']} cached results")
+
+    def _close(self):
+        # Library listener method, called when the execution ends. The underscore
+        # prefix keeps it from being exposed as a keyword.
+        if self.hits or self.misses:
+            logger.console(f"\n{self.format_statistics(self.statistics())} (pid {os.getpid()})")
@@ -0,0 +1,167 @@
+"""
+Resource Sampler Listener
+
+Robot Framework listener that samples the CPU, memory (RSS), open file descriptors and
+I/O counters of the worker process at a fixed interval, to find out whether a slow run
+is caused by CPU saturation, memory pressure or I/O waits. Samples are kept in memory in
+a ring buffer (the oldest samples are discarded when it is full) and the peak of every
+test is tracked while it runs, so no sample is needed after the test ends. Everything is
+written only once, when the execution ends:
+
+- ``resource_samples_<pid>.json``: samples (seconds since the start, CPU %, RSS bytes,
+  open files, bytes read, bytes written) and the start, end and peaks of every test, with
+  times in the same scale as the samples
+
+Each pabot worker writes its own file (the process id is part of the name). The coverage
+report shows the tests with the highest peaks when it receives the directory of the files.
+
+Usage:
+    robot --listener resources/libraries/ResourceSampler.py:reports/resources ./tests
+    pabot --processes 4 --listener resources/libraries/ResourceSampler.py:reports/resources:0.5 ./tests
+
+    # Add the peak-resource tests to the coverage report
+    python resources/libraries/test_coverage_validator.py reports/output.xml --resource-dir reports/resources
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from time import monotonic
+
+import psutil
+
+SAMPLE_COLUMNS = ['time_s', 'cpu_percent', 'rss_bytes', 'open_files', 'read_bytes', 'write_bytes']
+SAMPLES_PATTERN = 'resource_samples_[0-9]*.json'
+
+
+class ResourceSampler:
+    """Listener that samples the resources of the process while the tests run."""
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self, output_dir='reports/resources', interval=1.0, capacity=3600):
+        """
+        Initialize the sampler and start the sampling thread.
+
+        Args:
+            output_dir (str): Directory where the samples file is written (default: reports/resources)
+            interval (float): Seconds between two samples (default: 1.0)
+            capacity (int): Maximum number of samples kept, the oldest are discarded (default: 3600)
+        """
+        self.output_dir = Path(output_dir)
+        self.interval = float(interval)
+        self._process = psutil.Process()
+        self._started = monotonic()
+        self._samples = deque(maxlen=int(capacity))
+        self._tests = []
+        self._current = None
+        self._cpu = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # The first CPU reading of psutil is always 0, it sets the reference of the next one
+        self._process.cpu_percent(None)
+        self._thread = threading.Thread(target=self._run, name='ResourceSampler', daemon=True)
+        self._thread.start()
+
+    def start_test(self, name, attrs):
+        sample = self._sample(periodic=False)
+        with self._lock:
+            self._current = {
+                'name': attrs['longname'],
+                'start_s': sample[0],
+                'end_s': None,
+                'status': None,
+                'peak_cpu_percent': 0.0,
+                'peak_rss_bytes': sample[2],
+                'peak_open_files': sample[3],
+                '_start': (self._cpu_seconds(), sample[4], sample[5]),
+            }
+
+    def end_test(self, name, attrs):
+        sample = self._sample(periodic=False)
+        cpu_seconds = self._cpu_seconds()
+        with self._lock:
+            test = self._current
+            self._current = None
+            if test is None:
+                return
+            cpu_start, read_start, write_start = test.pop('_start')
+            duration = sample[0] - test['start_s']
+            # The average comes from the CPU times, so it is exact even for tests shorter than the interval
+            test.update(end_s=sample[0], status=attrs['status'],
+                        cpu_percent=round((cpu_seconds - cpu_start) / duration * 100, 1) if duration > 0 else 0.0,
+                        read_bytes=sample[4] - read_start, write_bytes=sample[5] - write_start)
+            self._tests.append(test)
+
+    def close(self):
+        """Stop the sampling and write the samples and test peaks of this process."""
+        self._stop.set()
+        self._thread.join(self.interval + 1)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            'pid': os.getpid(),
+            'interval_s': self.interval,
+            'columns': SAMPLE_COLUMNS,
+            'samples': list(self._samples),
+            'tests': self._tests,
+        }
+        with open(self.output_dir / f'resource_samples_{os.getpid()}.json', 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except psutil.Error:
+                return
+
+    def _cpu_seconds(self):
+        times = self._process.cpu_times()
+        return times.user + times.system
+
+    def _sample(self, periodic=True):
+        # The CPU percentage is measured since the previous periodic sample; the samples taken
+        # at the start and end of the tests are too close to each other and repeat the last value
+        process = self._process
+        with process.oneshot():
+            if periodic:
+                self._cpu = process.cpu_percent(None)
+            cpu = self._cpu
+            rss = process.memory_info().rss
+            open_files = process.num_fds() if hasattr(process, 'num_fds') else process.num_handles()
+            # I/O counters are not available on macOS
+            io = process.io_counters() if hasattr(process, 'io_counters') else None
+        sample = (round(monotonic() - self._started, 3), cpu, rss, open_files,
+                  io.read_bytes if io else 0, io.write_bytes if io else 0)
+
+        with self._lock:
+            self._samples.append(sample)
+            test = self._current
+            if test is not None:
+                if periodic:
+                    test['peak_cpu_percent'] = max(test['peak_cpu_percent'], cpu)
+                test['peak_rss_bytes'] = max(test['peak_rss_bytes'], rss)
+                test['peak_open_files'] = max(test['peak_open_files'], open_files)
+        return sample
+
+
+def load_test_peaks(resource_dir):
+    """
+    Read the test peaks of all the samples files of a directory.
+
+    Args:
+        resource_dir (str): Directory containing the resource_samples_<pid>.json files
+
+    Returns:
+        list: One dictionary per test, with the pid of the worker that executed it
+    """
+    tests = []
+    for path in sorted(Path(resource_dir).glob(SAMPLES_PATTERN)):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        for test in data['tests']:
+            tests.append(dict(test, pid=data['pid']))
+    return tests
@@ -0,0 +1,215 @@
+import csv
+import hashlib
+import json
+import os
+import pickle
+import struct
+from pathlib import Path
+from DataDriver.AbstractReaderClass import AbstractReaderClass
+from DataDriver.csv_reader import csv_reader
+
+# Increment when the cached format changes, so old cache files are not used
+CACHE_VERSION = 3
+
+# Rows written to the cache in each pickle record
+CACHE_CHUNK_SIZE = 1000
+
+DEFAULT_CACHE_DIRECTORY = '.datadriver_cache'
+
+# Fixed-size trailer of the cache files: magic, version, length of the pickle records and
+# number of rows. A file whose size does not match the trailer was not completely written
+CACHE_MAGIC = b'DDCACHE\0'
+CACHE_TRAILER = struct.Struct('<8sIQQ')
+
+
+class StreamingReader(AbstractReaderClass):
+    """DataDriver reader that streams CSV, XLSX and JSONL files.
+
+    Rows are read one by one, so large files are never loaded at once. The parsed rows are
+    cached in a pickle stream keyed by the SHA-256 of the file, the next workers and executions
+    read the cache instead of parsing the file again, one chunk of rows at a time. A truncated
+    cache file (checked with its trailer) or a corrupt one is parsed again and replaced.
+
+    With pabot, DataDriver itself distributes the rows between the workers (optimize_pabot),
+    so every row runs once. The shard options are only for runs where every worker executes
+    the whole suite, e.g. one CI job per shard.
+
+    Usage:
+        Library    DataDriver    file=${EXECDIR}/data/records.csv
+        ...    reader_class=${EXECDIR}/resources/libraries/StreamingReader.py
+        ...    file_search_strategy=None
+
+    Options (DataDriver keyword arguments):
+        file_format: csv, xlsx or jsonl (default: file extension)
+        encoding, dialect, delimiter, sheet_name...: same as the DataDriver csv and Excel readers
+        shard_index / shard_count: keep only the rows where index % shard_count == shard_index
+        cache: cache the parsed rows (default: True)
+        cache_dir: directory of the cache files (default: .datadriver_cache)
+
+    JSONL files have one JSON object per line, the keys of the first object are the header,
+    e.g. {"*** Test Cases ***": "Record 1", "${cpf}": "123.456.789-09", "[Tags]": "smoke"}
+    """
+
+    def get_data_from_source(self):
+        shard_index, shard_count = self.shard()
+        rows = self.cached_rows()
+        header = next(rows, None)
+        if header is None:
+            return self.data_table
+        self._analyse_header(header)
+        for index, row in enumerate(rows):
+            if index % shard_count == shard_index:
+                self._read_data_from_table(row)
+        return self.data_table
+
+    def option(self, name, default=None):
+        return self.kwargs.get(name, default) if self.kwargs else default
+
+    def flag(self, name, default):
+        return str(self.option(name, default)).lower() not in ('false', '0', 'no', 'none', '')
+
+    def source_format(self):
+        return str(self.option('file_format', Path(self.file).suffix.lstrip('.'))).lower()
+
+    def shard(self):
+        """Return the shard given in the options as (index, count), all rows by default."""
+        index, count = self.option('shard_index'), self.option('shard_count')
+        if index is None or count is None:
+            return 0, 1
+        return int(index) % int(count), int(count)
+
+    def cache_path(self):
+        """Return the cache file of the source, keyed by its content and the reader options."""
+        digest = hashlib.sha256()
+        with open(self.file, 'rb') as source:
+            for block in iter(lambda: source.read(1024 * 1024), b''):
+                digest.update(block)
+        options = [CACHE_VERSION, self.source_format(), self.sheet_name, self.csv_encoding, self.csv_dialect,
+                   self.delimiter, self.quotechar, self.escapechar, self.doublequote, self.skipinitialspace]
+        digest.update(json.dumps(options, default=str).encode('utf-8'))
+        directory = Path(self.option('cache_dir', DEFAULT_CACHE_DIRECTORY))
+        return directory / f'{Path(self.file).stem}_{digest.hexdigest()[:24]}.pickle'
+
+    def cached_rows(self):
+        """Yield the header and then the rows, from the cache or parsing the file."""
+        if not self.flag('cache', True):
+            yield from self.parse_rows()
+            return
+
+        cache_file = self.cache_path()
+        trailer = self.read_cache_trailer(cache_file)
+        if trailer is not None:
+            yield from self.read_cache(cache_file, *trailer)
+            return
+
+        # Parse the file writing the cache at the same time, the cache is only
+        # published when the whole file was read
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(temporary_file, 'wb') as cache:
+                rows = self.parse_rows()
+                header = next(rows, None)
+                if header is None:
+                    return
+                pickle.dump(header, cache, protocol=pickle.HIGHEST_PROTOCOL)
+                yield header
+                chunk = []
+                row_count = 0
+                for row in rows:
+                    chunk.append(row)
+                    row_count += 1
+                    yield row
+                    if len(chunk) == CACHE_CHUNK_SIZE:
+                        pickle.dump(chunk, cache, protocol=pickle.HIGHEST_PROTOCOL)
+                        chunk = []
+                if chunk:
+                    pickle.dump(chunk, cache, protocol=pickle.HIGHEST_PROTOCOL)
+                cache.write(CACHE_TRAILER.pack(CACHE_MAGIC, CACHE_VERSION, cache.tell(), row_count))
+            os.replace(temporary_file, cache_file)
+        finally:
+            if temporary_file.exists():
+                temporary_file.unlink()
+
+    @staticmethod
+    def read_cache_trailer(cache_file):
+        """Return the length of the records and the number of rows of a complete cache file, or None."""
+        try:
+            with open(cache_file, 'rb') as cache:
+                size = cache.seek(0, os.SEEK_END)
+                if size < CACHE_TRAILER.size:
+                    return None
+                cache.seek(size - CACHE_TRAILER.size)
+                magic, version, length, row_count = CACHE_TRAILER.unpack(cache.read(CACHE_TRAILER.size))
+        except OSError:
+            return None
+        if magic != CACHE_MAGIC or version != CACHE_VERSION or length != size - CACHE_TRAILER.size:
+            return None
+        return length, row_count
+
+    def read_cache(self, cache_file, length, row_count):
+        """Yield the header and the rows of a cache file, one chunk of rows in memory at a time.
+
+        If a record is corrupt, the cache file is removed and the rows not yielded yet are parsed from the file.
+        """
+        yielded = 0
+        try:
+            with open(cache_file, 'rb') as cache:
+                yield pickle.load(cache)
+                yielded += 1
+                while yielded <= row_count and cache.tell() < length:
+                    for row in pickle.load(cache):
+                        yield row
+                        yielded += 1
+            if yielded == row_count + 1:
+                return
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, IndexError):
+            pass
+
+        cache_file.unlink(missing_ok=True)
+        rows = self.parse_rows()
+        for _ in range(yielded):
+            next(rows, None)
+        yield from rows
+
+    def parse_rows(self):
+        """Yield the header and the non-empty rows of the file as lists of strings."""
+        parsers = {'csv': self.parse_csv, 'xlsx': self.parse_xlsx, 'jsonl': self.parse_jsonl}
+        file_format = self.source_format()
+        if file_format not in parsers:
+            raise ValueError(f"Unsupported file format '{file_format}', use one of: {', '.join(parsers)}")
+        for row in parsers[file_format]():
+            if any(cell != '' for cell in row):
+                yield row
+
+    def parse_csv(self):
+        # Same dialects (Excel-EU, userdefined...) as the DataDriver csv reader
+        csv_reader._register_dialects(self)
+        with open(self.file, encoding=self.csv_encoding, newline='') as csv_file:
+            yield from csv.reader(csv_file, self.csv_dialect)
+
+    def parse_xlsx(self):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(self.file, read_only=True, data_only=True)
+        try:
+            if str(self.sheet_name).isdigit():
+                sheet = workbook.worksheets[int(self.sheet_name)]
+            else:
+                sheet = workbook[self.sheet_name]
+            for values in sheet.iter_rows(values_only=True):
+                yield ['' if value is None else str(value) for value in values]
+        finally:
+            workbook.close()
+
+    def parse_jsonl(self):
+        header = None
+        with open(self.file, encoding='utf-8') as jsonl_file:
+            for line in jsonl_file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if header is None:
+                    header = list(record)
+                    yield header
+                yield ['' if record.get(key) is None else str(record.get(key)) for key in header]
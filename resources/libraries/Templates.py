@@ -0,0 +1,119 @@
+import re
+from functools import lru_cache
+from robot.api.deco import keyword, not_keyword
+
+ROBOT_LIBRARY_DOC_FORMAT = 'text'
+
+POSITIONAL_MARKER = '$$'
+DICTIONARY_MARKER = re.compile(r'\{([^{}]*)\}')
+
+
+@not_keyword
+@lru_cache(maxsize=512)
+def compile_positional_template(template):
+    '''
+    Splits a template in the literal parts around the '$$' markers.
+
+    The result is cached, so each template is parsed only once per process.
+
+    Arguments:
+        template (str): String containing the '$$' markers
+
+    Returns:
+        tuple: Literal parts of the template (number of markers + 1 items)
+    '''
+    return tuple(template.split(POSITIONAL_MARKER))
+
+
+@not_keyword
+@lru_cache(maxsize=512)
+def compile_dictionary_template(template):
+    '''
+    Splits a template in literal parts and '{key}' markers.
+
+    Only the first occurrence of each key is a marker, the following occurrences
+    are kept as literal text, as the 'String Replace Using Dictionary' keyword
+    always did. The result is cached, so each template is parsed only once per process.
+
+    Arguments:
+        template (str): String containing the '{key}' markers
+
+    Returns:
+        tuple: Parts of the template, markers are represented as (key,) tuples
+    '''
+    parts = []
+    seen = set()
+    position = 0
+    for match in DICTIONARY_MARKER.finditer(template):
+        key = match.group(1)
+        if key in seen:
+            continue
+        seen.add(key)
+        parts.append(template[position:match.start()])
+        parts.append((key,))
+        position = match.end()
+    parts.append(template[position:])
+    return tuple(parts)
+
+
+@keyword
+def render_positional_template(template, *replacement_strings):
+    '''
+    Replaces the '$$' markers of a template with the given strings, in order.
+
+    The template is compiled once and cached, and the result is built in a single pass.
+    Values are converted to strings and inserted as they are (a '$$' inside a value
+    is not replaced). Markers without a value are kept, extra values are ignored.
+
+    Arguments:
+        template (str): String containing the '$$' markers to be replaced
+        replacement_strings (list): Values that will be placed in place of the '$$' markers
+
+    Returns:
+        str: String with replaced markers
+
+    Example:
+        | ${path}= | Render Positional Template | ${RESOURCES_FILES}/$$/$$ | i18n | pt.json |
+    '''
+    parts = compile_positional_template(str(template))
+    if not replacement_strings:
+        return POSITIONAL_MARKER.join(parts)
+
+    values = [str(value) for value in replacement_strings[:len(parts) - 1]]
+    values.extend([POSITIONAL_MARKER] * (len(parts) - 1 - len(values)))
+
+    result = [parts[0]]
+    for value, literal in zip(values, parts[1:]):
+        result.append(value)
+        result.append(literal)
+    return ''.join(result)
+
+
+@keyword
+def render_dictionary_template(template, replacement_values):
+    '''
+    Replaces the '{key}' markers of a template with the values of a dictionary.
+
+    The template is compiled once and cached, and the result is built in a single pass.
+    Only the first occurrence of each key is replaced. Keys missing from the dictionary
+    are kept as they are, values are converted to strings and never re-scanned for markers.
+
+    Arguments:
+        template (str): String containing the '{key}' markers to be replaced
+        replacement_values (dict): Dictionary with keys and values for replacement
+
+    Returns:
+        str: String with replaced markers
+
+    Example:
+        | ${value}= | Render Dictionary Template | {date} - Scheduled {startDate} | ${DICTIONARY} |
+    '''
+    result = []
+    for part in compile_dictionary_template(str(template)):
+        if isinstance(part, str):
+            result.append(part)
+        elif part[0] in replacement_values:
+            result.append(str(replacement_values[part[0]]))
+        else:
+            result.append('{' + part[0] + '}')
+    return ''.join(result)
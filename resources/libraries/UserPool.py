@@ -0,0 +1,270 @@
+"""
+Book Store User Pool
+
+Provisions Book Store users and tokens up front and leases them to the tests, so the
+tests that only need an authorized user do not create one on their critical path.
+
+The pool is a JSON file shared by all pabot workers and protected by a file lock:
+the first worker provisions the users (in parallel, using BookStoreClient) and the
+others lease them. Tokens close to expiring are refreshed when a user is leased.
+
+Usage:
+    # In the suite
+    Provision User Pool    size=4
+    ${user}=    Lease Pooled User
+    Release Pooled User    ${user}
+
+    # After the run, delete all the users in bulk
+    python resources/libraries/UserPool.py cleanup reports/user_pool.json
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from robot.api import Failure, logger
+from robot.api.deco import keyword
+from BookStoreClient import BookStoreClient, DEFAULT_PASSWORD
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+DEFAULT_POOL_FILE = 'reports/user_pool.json'
+
+
+class FileLock:
+    """Exclusive lock on a file, shared between processes (fcntl on Linux/macOS, msvcrt on Windows)."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a+')
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+
+class UserPool:
+    """Library to lease pre-provisioned Book Store users to the tests.
+
+    The pool file is shared by every process that uses the same path, so pabot workers
+    never lease the same user at the same time. A lease older than ``lease_timeout``
+    seconds (e.g. of a worker that crashed) can be taken by another test.
+
+    The pool file records the API URL of its users. A pool of another URL (e.g. after a
+    DEMOQA_URL change or a file left by another run) is discarded and provisioned again.
+
+    = Usage =
+
+    | Provision User Pool   | size=4     |
+    | ${user}=              | Lease Pooled User |
+    | Log                   | ${user}[userName] ${user}[token] |
+    | Release Pooled User   | ${user}    |
+    | Cleanup User Pool     |            |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self, base_url='https://demoqa.com', pool_file=DEFAULT_POOL_FILE, lease_timeout=600,
+                 token_margin=300):
+        """Initialize the UserPool library.
+
+        Args:
+            base_url (str): Book Store API URL (default: https://demoqa.com)
+            pool_file (str): JSON file shared by the workers (default: reports/user_pool.json)
+            lease_timeout (int): Seconds after which a lease is considered abandoned (default: 600)
+            token_margin (int): Tokens expiring in less than these seconds are refreshed (default: 300)
+        """
+        self.base_url = str(base_url).rstrip('/')
+        self.pool_file = Path(pool_file)
+        self.lock_file = self.pool_file.with_suffix('.lock')
+        self.lease_timeout = int(lease_timeout)
+        self.token_margin = int(token_margin)
+        self.client = BookStoreClient(self.base_url)
+
+    @keyword('Provision User Pool')
+    def provision_user_pool(self, size=4, password=DEFAULT_PASSWORD, concurrency=None):
+        """Create users and tokens in parallel until the pool has ``size`` users.
+
+        Only the first worker creates the users, the others find the pool already provisioned.
+
+        Args:
+            size (int): Number of users in the pool (default: 4)
+            password (str): Password of the new users (default: a password accepted by the API)
+            concurrency (int): Maximum number of parallel requests (default: client concurrency)
+
+        Returns:
+            int: Number of users in the pool
+        """
+        with FileLock(self.lock_file):
+            pool = self._read()
+            missing = int(size) - len(pool['users'])
+            if missing > 0:
+                users = self.client.create_users_batch(missing, password, 'pool', concurrency)
+                self.client.generate_tokens_batch(users, concurrency)
+                for user in users:
+                    user['lease'] = None
+                pool['users'].extend(users)
+                self._write(pool)
+                logger.info(f"Provisioned {missing} users in the pool {self.pool_file}")
+            return len(pool['users'])
+
+    @keyword('Lease Pooled User')
+    def lease_pooled_user(self, timeout=60, owner=None):
+        """Lease a free user of the pool, refreshing its token if it is close to expiring.
+
+        Args:
+            timeout (float): Seconds to wait for a free user (default: 60)
+            owner (str): Name of the lease owner, for debugging (default: process id)
+
+        Returns:
+            dict: userName, password, userID, token and expires of the user
+
+        Raises:
+            Failure: If no user is free after the timeout
+        """
+        owner = owner or f'pid {os.getpid()}'
+        deadline = time.monotonic() + float(timeout)
+        while True:
+            with FileLock(self.lock_file):
+                pool = self._read()
+                now = time.time()
+                for user in pool['users']:
+                    lease = user.get('lease')
+                    if lease is None or now - lease['since'] > self.lease_timeout:
+                        if self._token_expiring(user):
+                            self.client.generate_tokens_batch([user])
+                            logger.info(f"Token of pooled user {user['userName']} refreshed")
+                        user['lease'] = {'owner': owner, 'since': now}
+                        self._write(pool)
+                        return {key: value for key, value in user.items() if key != 'lease'}
+            if not pool['users']:
+                raise Failure(f"The user pool {self.pool_file} is empty, use Provision User Pool first")
+            if time.monotonic() > deadline:
+                raise Failure(f"No free user in the pool {self.pool_file} after {timeout} seconds")
+            time.sleep(0.2)
+
+    @keyword('Release Pooled User')
+    def release_pooled_user(self, user):
+        """Return a leased user to the pool.
+
+        Args:
+            user (dict): User returned by `Lease Pooled User`
+        """
+        with FileLock(self.lock_file):
+            pool = self._read()
+            for pooled_user in pool['users']:
+                if pooled_user['userName'] == user['userName']:
+                    pooled_user['lease'] = None
+            self._write(pool)
+
+    @keyword('Cleanup User Pool')
+    def cleanup_user_pool(self, concurrency=None):
+        """Delete all the users of the pool in bulk and remove the pool file.
+
+        Must run when no test is using the pool anymore, e.g. after the pabot execution
+        (see the ``cleanup`` command of this module).
+
+        Args:
+            concurrency (int): Maximum number of parallel requests (default: client concurrency)
+
+        Returns:
+            int: Number of deleted users
+        """
+        with FileLock(self.lock_file):
+            pool = self._read(same_server=False)
+            users = pool['users']
+            # The users are deleted in the server where they were created
+            client = self.client if pool['base_url'] == self.base_url else BookStoreClient(pool['base_url'])
+            # The tests may have generated new tokens for the users, so all of them are renewed
+            client.generate_tokens_batch(users, concurrency)
+            client.delete_users_batch(users, concurrency)
+            if self.pool_file.exists():
+                self.pool_file.unlink()
+        logger.info(f"Deleted {len(users)} users of the pool {self.pool_file}")
+        return len(users)
+
+    def _token_expiring(self, user):
+        try:
+            expires = datetime.strptime(user['expires'].replace('Z', '+0000'), '%Y-%m-%dT%H:%M:%S.%f%z')
+        except (KeyError, TypeError, AttributeError, ValueError):
+            return True
+        return (expires - datetime.now(timezone.utc)).total_seconds() < self.token_margin
+
+    def _read(self, same_server=True):
+        if not self.pool_file.exists():
+            return {'base_url': self.base_url, 'users': []}
+        with open(self.pool_file, encoding='utf-8') as pool_file:
+            pool = json.load(pool_file)
+        pool_url = str(pool.get('base_url', '')).rstrip('/')
+        pool['base_url'] = pool_url
+        if same_server and pool_url != self.base_url:
+            logger.warn(f"The user pool {self.pool_file} has {len(pool['users'])} users of {pool_url}, "
+                        f"not of {self.base_url}; the pool is provisioned again")
+            return {'base_url': self.base_url, 'users': []}
+        return pool
+
+    def _write(self, pool):
+        temporary_file = self.pool_file.with_suffix('.tmp')
+        with open(temporary_file, 'w', encoding='utf-8') as pool_file:
+            json.dump(pool, pool_file, indent=2)
+        os.replace(temporary_file, self.pool_file)
+
+
+def main():
+    """
+    Main function for command-line execution.
+
+    Command-line arguments:
+        command: cleanup (delete every user of the pool)
+        pool_file: Path to the pool file (default: reports/user_pool.json)
+
+    Example usage:
+        python UserPool.py cleanup reports/user_pool.json
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Book Store User Pool')
+    parser.add_argument('command', choices=['cleanup'], help='Command to execute')
+    parser.add_argument('pool_file', nargs='?', default=DEFAULT_POOL_FILE,
+                        help=f'Path to the pool file (default: {DEFAULT_POOL_FILE})')
+    args = parser.parse_args()
+
+    if not Path(args.pool_file).exists():
+        print(f"User pool not found: {args.pool_file}")
+        return 0
+
+    with open(args.pool_file, encoding='utf-8') as pool_file:
+        base_url = json.load(pool_file).get('base_url', 'https://demoqa.com')
+    deleted = UserPool(base_url, args.pool_file).cleanup_user_pool()
+    print(f"Deleted {deleted} users of the pool {args.pool_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+import json
+import os
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from pathlib import Path
+from robot.api import Failure, logger
+from robot.api.deco import keyword, not_keyword
+
+
+def find_all(root, path):
+    """Return all elements matching a path, like XML.Get Elements.
+
+    ElementTree compiles each path once and keeps it in its own cache.
+
+    Args:
+        root (xml.etree.ElementTree.Element): Element where the path starts
+        path (str): ElementTree path (the XPath subset used by the Robot Framework XML library)
+
+    Returns:
+        list: Matching elements, in document order
+
+    Raises:
+        Failure: If the path is not valid
+    """
+    if not path:
+        raise Failure("No xpath given.")
+    if path[:1] == '/':
+        raise Failure(f"Cannot use absolute path '{path}' on element.")
+    try:
+        return root.findall(path)
+    except (SyntaxError, KeyError, StopIteration, TypeError):
+        raise Failure(f"Invalid xpath '{path}'.")
+
+
+def find_one(root, path):
+    """Return the only element matching a path, with the same errors as XML.Get Element."""
+    elements = find_all(root, path)
+    if not elements:
+        raise Failure(f"No element matching '{path}' found.")
+    if len(elements) > 1:
+        raise Failure(f"Multiple elements ({len(elements)}) matching '{path}' found.")
+    return elements[0]
+
+
+def element_text(element):
+    """Return the text of an element and its children, like XML.Get Element Text."""
+    return ''.join(element.itertext())
+
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else tag
+
+
+def strip_namespaces(root):
+    """Remove the namespaces of the tags, like XML.Parse XML does by default."""
+    for element in root.iter():
+        if isinstance(element.tag, str) and element.tag.startswith('{'):
+            element.tag = local_name(element.tag)
+    return root
+
+
+class XmlCache:
+    """Library to read XML files parsing each file only once.
+
+    Parsed trees are kept in an LRU cache keyed by the file path, modification time and size,
+    so a file changed on disk is parsed again. Paths use the same syntax and return the same
+    results as the Robot Framework XML library (namespaces are removed from the tags).
+
+    Large files can be read in streaming mode, which keeps in memory only the element being
+    processed.
+
+    = Usage =
+
+    | ${text}=     | Get XML Element Text   | ${file} | book/title   |                |
+    | ${values}=   | Get XML Element Texts  | ${file} | book/title   | book/author    |
+    | ${records}=  | Stream XML Elements    | ${file} | book         | title | author |
+    | ${count}=    | Write XML Elements To JSONL | ${file} | book    | ${output} | title |
+    """
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self, max_files=16):
+        """Initialize the XmlCache library.
+
+        Args:
+            max_files (int): Maximum number of parsed files kept in memory (default: 16)
+        """
+        self.max_files = int(max_files)
+        self.trees = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @not_keyword
+    def get_root(self, file_path):
+        """Return the root element of a file, parsing it only if it changed since the last call."""
+        path = Path(file_path).resolve()
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise Failure(f"XML file not found: {file_path}")
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self.trees.get(path)
+            if cached is not None and cached[0] == version:
+                self.trees.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+
+        root = strip_namespaces(ET.parse(path).getroot())
+        with self._lock:
+            self.misses += 1
+            self.trees[path] = (version, root)
+            self.trees.move_to_end(path)
+            while len(self.trees) > self.max_files:
+                self.trees.popitem(last=False)
+        return root
+
+    @keyword('Get XML Element Text')
+    def get_xml_element_text(self, file_path, xpath):
+        """Return the text of the only element matching the xpath.
+
+        Args:
+            file_path (str): Path of the XML file
+            xpath (str): Path of the element, same syntax as the XML library
+
+        Returns:
+            str: Text of the element, including the text of its children
+
+        Raises:
+            Failure: If no element or more than one element matches the xpath
+        """
+        return element_text(find_one(self.get_root(file_path), xpath))
+
+    @keyword('Get XML Element Texts')
+    def get_xml_element_texts(self, file_path, *xpaths, default=None):
+        """Return the texts of many elements, reading the file once.
+
+        Args:
+            file_path (str): Path of the XML file
+            xpaths (list): Paths of the elements, each one must match only one element
+            default (str): Text returned for the paths without elements (default: fail)
+
+        Returns:
+            dict: Text of the element by xpath
+
+        Raises:
+            Failure: If an xpath does not match exactly one element and no default is given
+        """
+        root = self.get_root(file_path)
+        texts = {}
+        errors = []
+        for xpath in xpaths:
+            elements = find_all(root, xpath)
+            if len(elements) == 1:
+                texts[xpath] = element_text(elements[0])
+            elif not elements and default is not None:
+                texts[xpath] = default
+            elif not elements:
+                errors.append(f"No element matching '{xpath}' found.")
+            else:
+                errors.append(f"Multiple elements ({len(elements)}) matching '{xpath}' found.")
+        if errors:
+            raise Failure('\n'.join(errors))
+        return texts
+
+    @keyword('Get XML Element Values')
+    def get_xml_element_values(self, file_path, xpath):
+        """Return the texts of all elements matching the xpath.
+
+        Args:
+            file_path (str): Path of the XML file
+            xpath (str): Path of the elements
+
+        Returns:
+            list: Texts of the elements, in document order
+        """
+        return [element_text(element) for element in find_all(self.get_root(file_path), xpath)]
+
+    @keyword('Log XML Cache Statistics')
+    def log_xml_cache_statistics(self):
+        """Log the number of files parsed and read from the cache.
+
+        Returns:
+            dict: hits, misses and files in the cache
+        """
+        statistics = {'hits': self.hits, 'misses': self.misses, 'files': len(self.trees)}
+        logger.info(f"XML cache: {statistics['hits']} hits, {statistics['misses']} files parsed, "
+                    f"{statistics['files']} files in memory")
+        return statistics
+
+    @keyword('Clear XML Cache')
+    def clear_xml_cache(self):
+        """Discard all parsed files."""
+        with self._lock:
+            self.trees.clear()
+
+    @keyword('Stream XML Elements')
+    def stream_xml_elements(self, file_path, tag, *xpaths, limit=None):
+        """Read the elements with a tag in streaming mode, without parsing the whole file.
+
+        Args:
+            file_path (str): Path of the XML file
+            tag (str): Tag of the elements, without namespace
+            xpaths (list): Paths, relative to each element, of the values to return
+                (default: attributes and texts of the direct children)
+            limit (int): Maximum number of elements to read (default: all)
+
+        Returns:
+            list: One dictionary per element, with the text of each xpath (None if not found)
+        """
+        records = []
+        for record in self.iterate_records(file_path, tag, xpaths):
+            records.append(record)
+            if limit is not None and len(records) >= int(limit):
+                break
+        return records
+
+    @keyword('Count XML Elements')
+    def count_xml_elements(self, file_path, tag):
+        """Count the elements with a tag in streaming mode.
+
+        Args:
+            file_path (str): Path of the XML file
+            tag (str): Tag of the elements, without namespace
+
+        Returns:
+            int: Number of elements
+        """
+        return sum(1 for _ in iterate_elements(file_path, tag))
+
+    @keyword('Write XML Elements To JSONL')
+    def write_xml_elements_to_jsonl(self, file_path, tag, output_path, *xpaths):
+        """Convert the elements with a tag to a JSONL file in streaming mode.
+
+        Memory stays constant for any file size. The JSONL file can be used as data
+        source of DataDriver with StreamingReader.
+
+        Args:
+            file_path (str): Path of the XML file
+            tag (str): Tag of the elements, without namespace
+            output_path (str): Path of the JSONL file
+            xpaths (list): Paths, relative to each element, of the values to write
+                (default: attributes and texts of the direct children)
+
+        Returns:
+            int: Number of elements written
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with open(output_path, 'w', encoding='utf-8') as output:
+            for record in self.iterate_records(file_path, tag, xpaths):
+                output.write(json.dumps(record, ensure_ascii=False) + '\n')
+                count += 1
+        logger.info(f"{count} '{tag}' elements written to {output_path}")
+        return count
+
+    @not_keyword
+    def iterate_records(self, file_path, tag, xpaths):
+        for element in iterate_elements(file_path, tag):
+            if xpaths:
+                record = {}
+                for xpath in xpaths:
+                    matches = find_all(element, xpath)
+                    record[xpath] = element_text(matches[0]) if matches else None
+            else:
+                record = dict(element.attrib)
+                for child in element:
+                    record[child.tag] = element_text(child)
+            yield record
+
+
+def iterate_elements(file_path, tag):
+    """Yield the elements with a tag while the file is parsed, removing them after use.
+
+    Each element is complete (with its children) when yielded and is removed from the
+    tree right after, as well as every element outside the requested ones, so memory
+    does not grow with the file size. Namespaces are removed from the tags.
+
+    Args:
+        file_path (str): Path of the XML file
+        tag (str): Tag of the elements, without namespace
+
+    Yields:
+        xml.etree.ElementTree.Element: Each element with the tag
+    """
+    if not os.path.exists(file_path):
+        raise Failure(f"XML file not found: {file_path}")
+    parents = []
+    open_matches = 0
+    for event, element in ET.iterparse(file_path, events=('start', 'end')):
+        if event == 'start':
+            element.tag = local_name(element.tag)
+            if element.tag == tag:
+                open_matches += 1
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if element.tag == tag:
+            open_matches -= 1
+            yield element
+        # Elements inside a match are kept until the match ends
+        if not open_matches and parents:
+            parents[-1].remove(element)
+            element.clear()
@@ -13,7 +13,7 @@ sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 # Set the timezone to Brazil/Sao Paulo
 brazil_tz = pytz.timezone('America/Sao_Paulo')
 
-def generate_markdown_report(result, min_coverage):
+def generate_markdown_report(result, min_coverage, resource_peaks=None):
     """
     Generates a test coverage report in Markdown format.
 
@@ -23,6 +23,7 @@ def generate_markdown_report(result, min_coverage):
     Args:
         result (ExecutionResult): Robot Framework test execution result object
         min_coverage (float): Minimum required coverage percentage
+        resource_peaks (list, optional): Test peaks recorded by the ResourceSampler listener
 
     Returns:
         str: Report in Markdown format with coverage statistics and suite details
@@ -70,11 +71,44 @@ def generate_markdown_report(result, min_coverage):
         suite_pass_percentage = (suite.passed / suite.total) * 100 if suite.total > 0 else 0
         markdown_report += f"| {suite.name} | {suite.total} | {suite.passed} | {suite_pass_percentage:.2f}% |\n"
 
+    if resource_peaks:
+        markdown_report += generate_resource_section(resource_peaks)
+
     # Add footer with Brazil timezone
     markdown_report += f"\n*Generated on: {datetime.now(brazil_tz).strftime('%Y-%m-%d %H:%M:%S')}*"
 
     return markdown_report
 
+def generate_resource_section(resource_peaks, limit=10):
+    """
+    Generates the Markdown table of the tests with the highest resource usage.
+
+    Args:
+        resource_peaks (list): Test peaks recorded by the ResourceSampler listener
+        limit (int, optional): Maximum number of tests of each ranking. Defaults to 10.
+
+    Returns:
+        str: Markdown table of the tests with the highest memory peaks and CPU usage
+    """
+    section = """
+### Peak Resource Tests
+| Test | Status | Duration (s) | Peak RSS (MiB) | Average CPU | Peak CPU | Open Files | Read (MiB) | Written (MiB) |
+|------|--------|--------------|----------------|-------------|----------|------------|------------|---------------|
+"""
+    by_memory = sorted(resource_peaks, key=lambda test: test['peak_rss_bytes'], reverse=True)[:limit]
+    by_cpu = sorted(resource_peaks, key=lambda test: test['cpu_percent'], reverse=True)[:limit]
+    # Tests with the highest memory peaks first, then the ones with the highest CPU usage
+    listed = []
+    for test in by_memory + by_cpu:
+        if test not in listed:
+            listed.append(test)
+    for test in listed:
+        section += (f"| {test['name']} | {test['status']} | {test['end_s'] - test['start_s']:.2f} | "
+                    f"{test['peak_rss_bytes'] / 2 ** 20:.1f} | {test['cpu_percent']:.0f}% | "
+                    f"{test['peak_cpu_percent']:.0f}% | {test['peak_open_files']} | {test['read_bytes'] / 2 ** 20:.1f} | "
+                    f"{test['write_bytes'] / 2 ** 20:.1f} |\n")
+    return section
+
 def save_markdown_report(report, output_dir):
     """
     Saves the Markdown report to a file.
@@ -111,7 +145,8 @@ def validate_test_coverage(
     output_file,
     min_coverage=80,
     output_dir='test_reports',
-    verbose=True
+    verbose=True,
+    resource_dir=None
 ):
     """
     Validates test coverage and generates a Markdown report.
@@ -125,6 +160,7 @@ def validate_test_coverage(
         min_coverage (float, optional): Minimum required coverage percentage. Defaults to 80.
         output_dir (str, optional): Directory to save reports. Defaults to 'test_reports'.
         verbose (bool, optional): Enables detailed logging. Defaults to True.
+        resource_dir (str, optional): Directory with the ResourceSampler files. Defaults to None.
 
     Raises:
         AssertionError: If test coverage is below the specified minimum.
@@ -141,8 +177,14 @@ def validate_test_coverage(
         passed_tests = result.statistics.total.passed
         pass_percentage = (passed_tests / total_tests) * 100
 
+        # Load the test peaks recorded by the ResourceSampler listener
+        resource_peaks = None
+        if resource_dir:
+            from ResourceSampler import load_test_peaks
+            resource_peaks = load_test_peaks(resource_dir)
+
         # Generate Markdown report
-        markdown_report = generate_markdown_report(result, min_coverage)
+        markdown_report = generate_markdown_report(result, min_coverage, resource_peaks)
 
         # Save Markdown report
         save_markdown_report(markdown_report, output_dir)
@@ -174,6 +216,7 @@ def main():
         --min-coverage: Minimum coverage percentage (default: 80)
         --output-dir: Directory to save reports (default: 'test_reports')
         --quiet: Disable detailed logging
+        --resource-dir: Directory with the ResourceSampler files (default: not reported)
 
     Example usage:
         python test_coverage_validator.py output.xml --min-coverage 85 --output-dir reports
@@ -188,6 +231,8 @@ def main():
                         help='Directory to save reports')
     parser.add_argument('--quiet', action='store_true',
                         help='Disable detailed logging')
+    parser.add_argument('--resource-dir', default=None,
+                        help='Directory with the ResourceSampler files, adds the peak resource tests')
 
     args = parser.parse_args()
 
@@ -195,7 +240,8 @@ def main():
         args.output_file,
         min_coverage=args.min_coverage,
         output_dir=args.output_dir,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        resource_dir=args.resource_dir
     )
 
 if __name__ == "__main__":